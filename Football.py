@@ -1,33 +1,47 @@
-import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-
-df = pd.read_csv("Football.csv")
-
-st.set_page_config(page_title="Futbol Analiz", layout="wide")
-
-st.title("⚽ La Liga Player Statistikasi")
-
-st.sidebar.header("Filter")
-
-year = st.sidebar.selectbox("Yil tanlang", df["Year"].unique())
-league = st.sidebar.selectbox("Liga tanlang", df["League"].unique())
-club = st.sidebar.selectbox("Klub tanlang", df["Club"].unique())
-
-filtered_df = df[
-    (df["Year"] == year) &
-    (df["League"] == league) &
-    (df["Club"] == club)
-]
-
-st.subheader("O'yinchilar ro'yxati")
-st.dataframe(filtered_df)
-
-st.subheader("Top 10 Eng Ko'p Gol")
-
-top_players = filtered_df.sort_values(by="Goals", ascending=False).head(10)
-
-plt.figure()
-plt.bar(top_players["Player Names"], top_players["Goals"])
-plt.xticks(rotation=45)
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from facet_filter import facet_counts, facet_options, football_facets, football_rows
+from football_index import load_football
+from leaderboard import football_leaderboard, get_top
+
+df = load_football()
+
+st.set_page_config(page_title="Futbol Analiz", layout="wide")
+
+st.title("⚽ La Liga Player Statistikasi")
+
+st.sidebar.header("Filter")
+
+# Bir nechta qiymat tanlash mumkin; qavsdagi son - boshqa filtrlar
+# bilan birga qolgan qatorlar soni. Faqat natija beradigan qiymatlar
+# taklif qilinadi (Yil -> Liga -> Klub kaskadi, facet_filter.py)
+FACET_LABELS = {"Year": "Yil", "Country": "Davlat", "League": "Liga", "Club": "Klub"}
+
+facets = football_facets()
+selections = {col: st.session_state.get(f"facet_{col}", []) for col in FACET_LABELS}
+counts = facet_counts(facets, selections)
+
+for col, label in FACET_LABELS.items():
+    st.sidebar.multiselect(
+        label,
+        facet_options(facets, counts, selections, col),
+        key=f"facet_{col}",
+        format_func=lambda value, col=col: f"{value} ({counts[col][value]})",
+    )
+
+rows = football_rows(selections)
+
+filtered_df = df if rows is None else df.iloc[rows]
+
+st.subheader("O'yinchilar ro'yxati")
+st.dataframe(filtered_df)
+
+st.subheader("Top 10 Eng Ko'p Gol")
+
+top_players = get_top(football_leaderboard(), "Goals", rows=rows)
+
+plt.figure()
+plt.bar(top_players["Player Names"], top_players["Goals"])
+plt.xticks(rotation=45)
 st.pyplot(plt)
\ No newline at end of file
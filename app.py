@@ -1,45 +1,57 @@
-import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-
-# Sahifa sozlamasi
-st.set_page_config(page_title="Futbol Analiz", layout="wide")
-
-st.title(" Futbol Player Statistikasi Dashboard")
-
-# CSV faylni o‘qish
-df = pd.read_csv("Football.csv")
-
-# Sidebar filterlar
-st.sidebar.header("Filter")
-
-year = st.sidebar.selectbox("Yil tanlang", sorted(df["Year"].unique()))
-league = st.sidebar.selectbox("Liga tanlang", df["League"].unique())
-club = st.sidebar.selectbox("Klub tanlang", df["Club"].unique())
-
-# Filtrlash
-filtered_df = df[
-    (df["Year"] == year) &
-    (df["League"] == league) &
-    (df["Club"] == club)
-]
-
-st.subheader(" O'yinchilar ro'yxati")
-st.dataframe(filtered_df)
-
-# Agar ma'lumot bo‘lsa grafik chiqarish
-if not filtered_df.empty:
-    st.subheader(" Top 10 Eng Ko'p Gol Urganlar")
-
-    top_players = filtered_df.sort_values(
-        by="Goals", ascending=False
-    ).head(10)
-
-    plt.figure()
-    plt.bar(top_players["Player Names"], top_players["Goals"])
-    plt.xticks(rotation=45)
-    plt.xlabel("O'yinchi")
-    plt.ylabel("Gollar")
-    st.pyplot(plt)
-else:
+import streamlit as st
+import matplotlib.pyplot as plt
+
+from facet_filter import facet_counts, facet_options, football_facets, football_rows
+from football_index import load_football
+from leaderboard import football_leaderboard, get_top
+
+# Sahifa sozlamasi
+st.set_page_config(page_title="Futbol Analiz", layout="wide")
+
+st.title(" Futbol Player Statistikasi Dashboard")
+
+# CSV faylni o‘qish
+df = load_football()
+
+# Sidebar filterlar
+st.sidebar.header("Filter")
+
+# Bir nechta qiymat tanlash mumkin; qavsdagi son - boshqa filtrlar
+# bilan birga qolgan qatorlar soni. Faqat natija beradigan qiymatlar
+# taklif qilinadi (Yil -> Liga -> Klub kaskadi, facet_filter.py)
+FACET_LABELS = {"Year": "Yil", "Country": "Davlat", "League": "Liga", "Club": "Klub"}
+
+facets = football_facets()
+selections = {col: st.session_state.get(f"facet_{col}", []) for col in FACET_LABELS}
+counts = facet_counts(facets, selections)
+
+for col, label in FACET_LABELS.items():
+    st.sidebar.multiselect(
+        label,
+        facet_options(facets, counts, selections, col),
+        key=f"facet_{col}",
+        format_func=lambda value, col=col: f"{value} ({counts[col][value]})",
+    )
+
+rows = football_rows(selections)
+
+# Filtrlash
+filtered_df = df if rows is None else df.iloc[rows]
+
+st.subheader(" O'yinchilar ro'yxati")
+st.dataframe(filtered_df)
+
+# Agar ma'lumot bo‘lsa grafik chiqarish
+if not filtered_df.empty:
+    st.subheader(" Top 10 Eng Ko'p Gol Urganlar")
+
+    top_players = get_top(football_leaderboard(), "Goals", rows=rows)
+
+    plt.figure()
+    plt.bar(top_players["Player Names"], top_players["Goals"])
+    plt.xticks(rotation=45)
+    plt.xlabel("O'yinchi")
+    plt.ylabel("Gollar")
+    st.pyplot(plt)
+else:
     st.warning("Ma'lumot topilmadi.")
\ No newline at end of file
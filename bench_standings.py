@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from standings_engine import (
+    build_state,
+    check_state,
+    compute_standings,
+    state_matches,
+    update_state,
+)
+
+# =========================
+# STANDINGS BENCHMARK
+# =========================
+# Sun'iy 100k o'yinli jadvalda vektorli standings_engine va chempion.py dagi
+# eski iterrows sikli solishtiriladi. Ishga tushirish:
+#   python bench_standings.py
+# Oxirida haqiqiy match faylining saqlangan holati (.data_cache) to'liq hisob
+# bilan tekshiriladi (farq bo'lsa qayta quriladi).
+
+N_MATCHES = 100_000
+N_TEAMS = 36
+
+
+def synthetic_matches(n_matches=N_MATCHES, n_teams=N_TEAMS, seed=0):
+    rng = np.random.default_rng(seed)
+    teams = np.array([f"Team {i:02d}" for i in range(n_teams)])
+    home = rng.integers(0, n_teams, n_matches)
+    away = (home + rng.integers(1, n_teams, n_matches)) % n_teams
+    return pd.DataFrame({
+        "home_team": teams[home],
+        "away_team": teams[away],
+        "home_goals": rng.poisson(1.5, n_matches).astype("float64"),
+        "away_goals": rng.poisson(1.2, n_matches).astype("float64"),
+    })
+
+
+def iterrows_standings(df):
+    # chempion.py dagi eski usul (faqat solishtirish uchun)
+    teams = list(set(df["home_team"]).union(set(df["away_team"])))
+    points = {team: 0 for team in teams}
+    goal_diff = {team: 0 for team in teams}
+
+    for _, row in df.iterrows():
+        home = row["home_team"]
+        away = row["away_team"]
+        hg = row["home_goals"]
+        ag = row["away_goals"]
+
+        goal_diff[home] += hg - ag
+        goal_diff[away] += ag - hg
+
+        if hg > ag:
+            points[home] += 3
+        elif hg < ag:
+            points[away] += 3
+        else:
+            points[home] += 1
+            points[away] += 1
+
+    return pd.DataFrame({"Points": points, "Goal Difference": goal_diff})
+
+
+def timed(func, *args, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+if __name__ == "__main__":
+    df = synthetic_matches()
+
+    fast, fast_time = timed(compute_standings, df, repeat=5)
+    slow, slow_time = timed(iterrows_standings, df)
+
+    slow = slow.loc[fast.index]
+    assert (slow["Points"] == fast["Points"]).all()
+    assert (slow["Goal Difference"] == fast["Goal Difference"]).all()
+
+    print(f"{len(df):,} matches, {N_TEAMS} teams")
+    print(f"iterrows:   {slow_time * 1000:10.1f} ms")
+    print(f"vectorized: {fast_time * 1000:10.1f} ms")
+    print(f"speedup:    {slow_time / fast_time:10.0f}x")
+
+    # Yangi matchday (18 o'yin) qo'shilganda holatni yangilash
+    state = build_state(df.iloc[:-18])
+    updated, update_time = timed(update_state, state, df, repeat=5)
+    assert state_matches(updated, df)
+    print(f"append 18:  {update_time * 1000:10.1f} ms")
+
+    # Saqlangan holat (haqiqiy match fayli) to'liq hisob bilan tekshiriladi
+    print(f"saved state: {'ok' if check_state() else 'rebuilt'}")
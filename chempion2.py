@@ -1,187 +1,235 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import random
-
-st.set_page_config(page_title="UCL 2025-26 Dashboard", layout="wide")
-st.title("UEFA Champions League 2025-26 Data Analysis Dashboard")
-
-
-# LOAD DATA
-
-df = pd.read_csv("ucl_2025_26_matches_with_goals.csv")
-
-df["home_goals"] = pd.to_numeric(df["home_goals"], errors="coerce")
-df["away_goals"] = pd.to_numeric(df["away_goals"], errors="coerce")
-df["total_goals"] = df["home_goals"] + df["away_goals"]
-
-
-# 1️ ENG KOP GOL URGAN JAMOA
-
-home_goals = df.groupby("home_team")["home_goals"].sum()
-away_goals = df.groupby("away_team")["away_goals"].sum()
-total_scored = home_goals.add(away_goals, fill_value=0).sort_values(ascending=False)
-
-st.subheader(" Eng kop gol urgan jamoalar")
-fig1 = px.bar(total_scored.head(10),
-              title="Top 10 Goal Scoring Teams",
-              labels={"value":"Goals","index":"Team"})
-st.plotly_chart(fig1, use_container_width=True)
-
-
-# 2️ ENG KO‘P GOL O‘TKAZGAN JAMOA
-
-home_conceded = df.groupby("home_team")["away_goals"].sum()
-away_conceded = df.groupby("away_team")["home_goals"].sum()
-total_conceded = home_conceded.add(away_conceded, fill_value=0).sort_values(ascending=False)
-
-st.subheader(" Eng kop gol otkazgan jamoalar")
-fig2 = px.bar(total_conceded.head(10),
-              title="Most Goals Conceded",
-              labels={"value":"Goals","index":"Team"})
-st.plotly_chart(fig2, use_container_width=True)
-
-
-# 3️ UY VS SAFAR
-
-st.subheader(" Uy vs  Safar Statistikasi")
-
-home_total = df["home_goals"].sum()
-away_total = df["away_goals"].sum()
-
-col1, col2 = st.columns(2)
-col1.metric("Uyda urilgan jami gollar", int(home_total))
-col2.metric("Safarda urilgan jami gollar", int(away_total))
-
-
-# 4️ ENG NATIJADOR O‘YINLAR
-
-st.subheader(" Eng natijador oyinlar")
-top_matches = df.sort_values("total_goals", ascending=False).head(10)
-
-st.dataframe(
-    top_matches[["date","home_team","away_team",
-                 "home_goals","away_goals","total_goals"]]
-)
-
-
-# 5️ O‘RTACHA GOL
-
-st.subheader(" Ortacha gol korsatkichi")
-
-avg_goals = df["total_goals"].mean()
-st.metric("Har oyinga ortacha gol", round(avg_goals, 2))
-
-fig3 = px.histogram(df, x="total_goals", nbins=12,
-                    title="Goal Distribution Per Match")
-st.plotly_chart(fig3, use_container_width=True)
-
-
-# 6️ CHEMPION BASHORATI (POINT SYSTEM)
-
-st.subheader(" Kubok sohibi bashorati (Points Model)")
-
-teams = list(set(df["home_team"]).union(set(df["away_team"])))
-points = {team: 0 for team in teams}
-goal_diff = {team: 0 for team in teams}
-
-for _, row in df.iterrows():
-    home = row["home_team"]
-    away = row["away_team"]
-    hg = row["home_goals"]
-    ag = row["away_goals"]
-
-    goal_diff[home] += hg - ag
-    goal_diff[away] += ag - hg
-
-    if hg > ag:
-        points[home] += 3
-    elif hg < ag:
-        points[away] += 3
-    else:
-        points[home] += 1
-        points[away] += 1
-
-table = pd.DataFrame({
-    "Points": points,
-    "Goal Difference": goal_diff
-}).sort_values(["Points","Goal Difference"], ascending=False)
-
-st.dataframe(table.head(10))
-predicted_champion = table.index[0]
-st.success(f" Points modeli bo‘yicha chempion: {predicted_champion}")
-
-
-# 7️ FINALGACHA TURNIR SIMULYATSIYASI (MONTE CARLO)
-
-st.subheader(" Finalgacha Turnir Simulyatsiyasi")
-
-home_scored_avg = df.groupby("home_team")["home_goals"].mean()
-away_scored_avg = df.groupby("away_team")["away_goals"].mean()
-
-home_conceded_avg = df.groupby("home_team")["away_goals"].mean()
-away_conceded_avg = df.groupby("away_team")["home_goals"].mean()
-
-team_strength = {}
-
-for team in teams:
-    attack = (home_scored_avg.get(team, 0) +
-              away_scored_avg.get(team, 0)) / 2
-
-    defense = (home_conceded_avg.get(team, 0) +
-               away_conceded_avg.get(team, 0)) / 2
-
-    team_strength[team] = attack - defense
-
-
-def simulate_match(team1, team2):
-    lambda1 = max(team_strength[team1] + 1.5, 0.2)
-    lambda2 = max(team_strength[team2] + 1.5, 0.2)
-
-    g1 = np.random.poisson(lambda1)
-    g2 = np.random.poisson(lambda2)
-
-    if g1 > g2:
-        return team1
-    elif g2 > g1:
-        return team2
-    else:
-        return random.choice([team1, team2])
-
-
-def simulate_tournament():
-    current = teams.copy()
-    random.shuffle(current)
-
-    while len(current) > 1:
-        next_round = []
-        for i in range(0, len(current)-1, 2):
-            winner = simulate_match(current[i], current[i+1])
-            next_round.append(winner)
-        current = next_round
-
-    return current[0]
-
-
-simulations = st.slider("Simulyatsiya soni", 100, 5000, 1000)
-
-results = {}
-
-for _ in range(simulations):
-    winner = simulate_tournament()
-    results[winner] = results.get(winner, 0) + 1
-
-prob_df = (pd.Series(results) / simulations * 100).sort_values(ascending=False)
-
-st.write("## Chempion bolish ehtimoli (%)")
-st.dataframe(prob_df.round(2))
-
-fig_sim = px.bar(prob_df.head(10),
-                 title="Top 10 Champion Probability (%)",
-                 labels={"value":"Probability %","index":"Team"})
-st.plotly_chart(fig_sim, use_container_width=True)
-
-
-st.success(f" Simulyatsiya boyicha eng ehtimolli chempion: {prob_df.index[0]}")
-
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+
+from match_data import load_matches
+from simulation_engine import (
+    BASE_GOALS,
+    MAX_WORKERS,
+    ess_summary,
+    exact_probabilities,
+    match_lambdas,
+    seeded_bracket,
+    simulate_scenarios,
+    stream_simulation,
+    team_strengths,
+)
+from standings_engine import standings
+
+st.set_page_config(page_title="UCL 2025-26 Dashboard", layout="wide")
+st.title("UEFA Champions League 2025-26 Data Analysis Dashboard")
+
+
+# LOAD DATA
+
+df = load_matches()
+
+# Jamoa jami ko'rsatkichlari (gollar, ochko, to'p farqi) saqlangan holatdan
+# olinadi; yangi qatorlar qo'shilganda faqat ular hisoblanadi
+# (standings_engine.py)
+table = standings()
+
+
+# 1️ ENG KOP GOL URGAN JAMOA
+
+total_scored = table["Goals For"].sort_values(ascending=False)
+
+st.subheader(" Eng kop gol urgan jamoalar")
+fig1 = px.bar(total_scored.head(10),
+              title="Top 10 Goal Scoring Teams",
+              labels={"value":"Goals","index":"Team"})
+st.plotly_chart(fig1, use_container_width=True)
+
+
+# 2️ ENG KO‘P GOL O‘TKAZGAN JAMOA
+
+total_conceded = table["Goals Against"].sort_values(ascending=False)
+
+st.subheader(" Eng kop gol otkazgan jamoalar")
+fig2 = px.bar(total_conceded.head(10),
+              title="Most Goals Conceded",
+              labels={"value":"Goals","index":"Team"})
+st.plotly_chart(fig2, use_container_width=True)
+
+
+# 3️ UY VS SAFAR
+
+st.subheader(" Uy vs  Safar Statistikasi")
+
+home_total = df["home_goals"].sum()
+away_total = df["away_goals"].sum()
+
+col1, col2 = st.columns(2)
+col1.metric("Uyda urilgan jami gollar", int(home_total))
+col2.metric("Safarda urilgan jami gollar", int(away_total))
+
+
+# 4️ ENG NATIJADOR O‘YINLAR
+
+st.subheader(" Eng natijador oyinlar")
+top_matches = df.sort_values("total_goals", ascending=False).head(10)
+
+st.dataframe(
+    top_matches[["date","home_team","away_team",
+                 "home_goals","away_goals","total_goals"]]
+)
+
+
+# 5️ O‘RTACHA GOL
+
+st.subheader(" Ortacha gol korsatkichi")
+
+avg_goals = df["total_goals"].mean()
+st.metric("Har oyinga ortacha gol", round(avg_goals, 2))
+
+fig3 = px.histogram(df, x="total_goals", nbins=12,
+                    title="Goal Distribution Per Match")
+st.plotly_chart(fig3, use_container_width=True)
+
+
+# 6️ CHEMPION BASHORATI (POINT SYSTEM)
+
+st.subheader(" Kubok sohibi bashorati (Points Model)")
+
+st.dataframe(table.head(10))
+predicted_champion = table.index[0]
+st.success(f" Points modeli bo‘yicha chempion: {predicted_champion}")
+
+
+# 7️ FINALGACHA TURNIR SIMULYATSIYASI (MONTE CARLO)
+
+st.subheader(" Finalgacha Turnir Simulyatsiyasi")
+
+# Barcha simulyatsiyalar (n_sims x n_matches) massivlarda, bir nechta
+# protsessda o'ynaladi (simulation_engine.py)
+simulations = st.slider("Simulyatsiya soni (maksimal)", 100, 10_000_000, 100_000, step=100)
+
+col1, col2, col3 = st.columns(3)
+workers = col1.number_input("Protsesslar", 1, MAX_WORKERS, MAX_WORKERS)
+ci_target = col2.number_input("CI kengligi (foiz punkti, 0 - o'chirilgan)", 0.0, 10.0, 0.5, step=0.1)
+seed = col3.number_input("Seed", 0, 2**32 - 1, 0)
+
+# Tasodifiy qur'a faqat Monte Carlo bilan; belgilangan setka (1-36, 2-35, ...
+# jadval bo'yicha) uchun aniq ehtimollar ham hisoblanadi
+draw = st.radio("Qur'a", ["Tasodifiy", "Jadval bo'yicha setka"], horizontal=True)
+bracket = seeded_bracket(table.index) if draw != "Tasodifiy" else None
+
+settings = (simulations, int(workers), ci_target, int(seed), draw)
+
+# Natijalar har bir bo'lakdan keyin yangilanadi. "To'xtatish" bosilganda
+# sahifa qayta ishga tushadi (joriy hisob to'xtaydi) va oxirgi oraliq natija
+# ko'rsatiladi; sozlamalar o'zgarsa simulyatsiya qaytadan boshlanadi
+col1, col2 = st.columns(2)
+if col1.button("To'xtatish"):
+    st.session_state["sim_cancelled"] = settings
+cancelled = st.session_state.get("sim_cancelled") == settings
+if cancelled and col2.button("Qayta ishga tushirish"):
+    del st.session_state["sim_cancelled"]
+    cancelled = False
+
+progress = st.progress(0.0)
+metrics_slot = st.empty()
+st.write("## Chempion bolish ehtimoli (%)")
+table_slot = st.empty()
+chart_slot = st.empty()
+
+# Aniq (DP) natija - belgilangan setka uchun sampler bilan solishtiriladi
+exact = exact_probabilities(df, bracket) if bracket is not None else None
+
+
+def show_result(result):
+    progress.progress(
+        min(result["n_sims"] / result["max_sims"], 1.0),
+        text=f"{result['n_sims']:,} / {result['max_sims']:,}",
+    )
+
+    with metrics_slot.container():
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Simulyatsiyalar", f"{result['n_sims']:,}")
+        col2.metric("Sims/sec", f"{result['sims_per_sec']:,.0f}")
+        col3.metric("Maks. 95% CI kengligi", f"{result['ci_width'] * 100:.2f} pp")
+
+    if exact is None:
+        table_slot.dataframe(result["table"].round(2))
+    else:
+        table_slot.dataframe(exact.join(result["table"], rsuffix=" (MC)").round(2))
+
+    fig_sim = px.bar(result["table"]["Probability %"].head(10),
+                     title="Top 10 Champion Probability (%)",
+                     labels={"value":"Probability %","index":"Team"})
+    chart_slot.plotly_chart(fig_sim, use_container_width=True)
+
+
+partial = st.session_state.get("sim_partial")
+result = partial[1] if partial is not None and partial[0] == settings else None
+if cancelled:
+    # Shu sozlamalar uchun hali oraliq natija bo'lmasa, simulyatsiya
+    # qayta boshlanmaydi - bo'sh holat ko'rsatiladi
+    if result is None:
+        st.info("Simulyatsiya to'xtatildi - hali natija yo'q.")
+    else:
+        show_result(result)
+        if not result["complete"]:
+            st.warning("Simulyatsiya to'xtatildi - oraliq natija ko'rsatilmoqda.")
+else:
+    for result in stream_simulation(
+        df,
+        simulations,
+        seed=int(seed),
+        workers=int(workers),
+        ci_width=ci_target / 100 if ci_target > 0 else None,
+        bracket=bracket,
+    ):
+        st.session_state["sim_partial"] = (settings, result)
+        show_result(result)
+
+if result is not None:
+    prob_df = result["table"]["Probability %"]
+
+    st.success(f" Simulyatsiya boyicha eng ehtimolli chempion: {prob_df.index[0]}")
+
+
+# 8️ "WHAT IF" SSENARIYLARI (VARIANCE REDUCTION)
+
+st.subheader(" Ssenariylarni solishtirish")
+
+# Ikkala ssenariy bir xil tasodifiy sonlar bilan o'ynaladi (CRN), shuning
+# uchun farqni ajratish uchun kamroq simulyatsiya yetadi
+col1, col2, col3 = st.columns(3)
+base_a = col1.number_input("A: bazaviy gol (lambda)", 0.0, 5.0, BASE_GOALS, step=0.1)
+base_b = col2.number_input("B: bazaviy gol (lambda)", 0.0, 5.0, 1.8, step=0.1)
+scenario_sims = col3.slider("Simulyatsiyalar", 1_000, 500_000, 20_000, step=1_000)
+
+col1, col2, col3 = st.columns(3)
+common = col1.checkbox("Common random numbers", value=True)
+antithetic = col2.checkbox("Antithetic", value=True)
+stratified = col3.checkbox("Stratified qur'a", value=True)
+
+strengths = team_strengths(df)
+scenarios = simulate_scenarios(
+    [match_lambdas(strengths, base_a), match_lambdas(strengths, base_b)],
+    scenario_sims,
+    seed=int(seed),
+    antithetic=antithetic,
+    stratified=stratified,
+    common=common,
+    bracket=None if bracket is None else strengths.index.get_indexer(bracket),
+)
+
+what_if = pd.DataFrame({
+    "A %": scenarios["probs"][0] * 100,
+    "B %": scenarios["probs"][1] * 100,
+    "B - A (pp)": scenarios["diff"][1] * 100,
+    "Farq std. xato (pp)": scenarios["diff_stderr"][1] * 100,
+}, index=strengths.index).sort_values("A %", ascending=False)
+
+col1, col2, col3 = st.columns(3)
+col1.metric("Simulyatsiyalar", f"{scenarios['n_sims']:,}")
+col2.metric("ESS / n (A)", f"{ess_summary(scenarios):.2f}")
+col3.metric(
+    "Farq dispersiyasi kamayishi",
+    f"{np.nanmedian(scenarios['diff_gain'][1]):.1f}x",
+)
+
+st.dataframe(what_if.head(15).round(3))
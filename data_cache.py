@@ -0,0 +1,394 @@
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+# =========================
+# DATASET CACHE
+# =========================
+# Har bir CSV birinchi o'qilganda Parquet snapshotga aylantiriladi.
+# Snapshot nomida manba faylning kontent hashi bor, shuning uchun fayl
+# o'zgarmaguncha CSV qayta parse qilinmaydi.
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(DATA_DIR, ".data_cache")
+
+try:
+    import pyarrow  # noqa: F401
+    SNAPSHOT_FORMAT = "parquet"
+except ImportError:
+    SNAPSHOT_FORMAT = "pickle"
+
+# Keshdagi frame'lar butun jarayon (barcha Streamlit sessiyalari) uchun
+# bitta nusxada saqlanadi va tashqariga faqat sayoz view sifatida
+# beriladi. Copy-on-Write bilan view'ga yozish umumiy buferlarni
+# o'zgartirmaydi (pandas >= 3 da u doim yoqilgan).
+if int(pd.__version__.split(".")[0]) < 3:
+    try:
+        pd.set_option("mode.copy_on_write", True)
+    except (KeyError, pd.errors.OptionError):
+        pass
+
+# path -> (stat signature, content digest)
+_digests = {}
+
+# cache key -> (dataset version, DataFrame)
+_frames = {}
+
+
+def data_path(name):
+    return name if os.path.isabs(name) else os.path.join(DATA_DIR, name)
+
+
+def _stat_signature(path):
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stem(name):
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def _stat_file(name):
+    return os.path.join(CACHE_DIR, f"{_stem(name)}.stat")
+
+
+def dataset_version(name):
+    # mtime/size o'zgarmagan bo'lsa, oldingi hash ishlatiladi;
+    # aks holda fayl qayta hashlanadi (faqat "touch" qilingan fayl
+    # snapshotni qayta qurishga olib kelmaydi)
+    path = data_path(name)
+    signature = _stat_signature(path)
+
+    cached = _digests.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = None
+    try:
+        with open(_stat_file(name)) as f:
+            saved_signature, saved_digest = f.read().split()
+        if saved_signature == signature:
+            digest = saved_digest
+    except (OSError, ValueError):
+        pass
+
+    if digest is None:
+        digest = _file_digest(path)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(_stat_file(name), "w") as f:
+                f.write(f"{signature} {digest}")
+        except OSError:
+            pass
+
+    _digests[path] = (signature, digest)
+    return digest
+
+
+# Snapshot formati yoki parse qoidalari o'zgarganda (kod hashi ushlamaydigan
+# holatlar uchun) qo'lda oshiriladi - barcha eski snapshotlar yaroqsiz bo'ladi
+SNAPSHOT_VERSION = 2
+
+# function/module -> source hash
+_code_hashes = {}
+
+
+def code_hash(obj):
+    cached = _code_hashes.get(obj)
+    if cached is None:
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = f"{obj.__module__}.{obj.__qualname__}"
+        cached = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+        _code_hashes[obj] = cached
+    return cached
+
+
+def _options_key(transform, compact, read_kwargs):
+    # read_csv parametrlari, transform yoki compact qoidalari kodi
+    # boshqacha bo'lsa, alohida snapshot. Transform moduli to'liq
+    # hashlanadi, shunda yordamchi funksiyalar (masalan, _extract_numbers)
+    # o'zgarishi ham snapshotni yangilaydi.
+    options = f"v{SNAPSHOT_VERSION}|" + repr(sorted(read_kwargs.items()))
+    if transform is not None:
+        source = code_hash(inspect.getmodule(transform) or transform)
+        options += f"|{transform.__module__}.{transform.__qualname__}|{source}"
+    if compact:
+        options += f"|compact|{CATEGORY_MAX_RATIO}|{code_hash(compact_frame)}"
+    return hashlib.blake2b(options.encode(), digest_size=6).hexdigest()
+
+
+def _snapshot_path(name, version, options_key):
+    return os.path.join(
+        CACHE_DIR, f"{_stem(name)}.{options_key}.{version}.{SNAPSHOT_FORMAT}"
+    )
+
+
+def _read_snapshot(path):
+    if SNAPSHOT_FORMAT == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_snapshot(df, path):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if SNAPSHOT_FORMAT == "parquet":
+        df.to_parquet(tmp_path)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _remove_stale_snapshots(name, keep):
+    # Har bir manba fayl ilovalarda bitta parametrlar to'plami bilan
+    # o'qiladi, shuning uchun faylning boshqa barcha snapshotlari (eski
+    # kontent versiyasi, eski kod yoki parametrlar) o'chiriladi
+    stem = _stem(name)
+    for filename in os.listdir(CACHE_DIR):
+        parts = filename.split(".")
+        if len(parts) != 4 or parts[0] != stem or parts[3] != SNAPSHOT_FORMAT:
+            continue
+        path = os.path.join(CACHE_DIR, filename)
+        if path != keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def shared_view(df):
+    # Ustun qo'shish/o'chirish faqat shu view'ga ta'sir qiladi,
+    # ma'lumot buferlari esa umumiy qoladi
+    return df.copy(deep=False)
+
+
+# =========================
+# COMPACT DTYPES
+# =========================
+# Takrorlanuvchi matn ustunlari "category"ga, butun sonlar eng kichik
+# int turiga o'tkaziladi.
+
+CATEGORY_MAX_RATIO = 0.5
+
+
+def frame_bytes(df):
+    # Indeks faqat nbytes bilan o'lchanadi: memory_usage(deep=True) join
+    # paytida qurilgan indeks hash-jadvalini ham qo'shib yuboradi
+    return int(df.memory_usage(index=False, deep=True).sum()) + int(df.index.nbytes)
+
+
+def compact_frame(df, category_max_ratio=CATEGORY_MAX_RATIO):
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_integer_dtype(series.dtype):
+            series = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series.dtype):
+            # Bo'sh qiymatli butun statistikalar (goals, saves, ...) float
+            # bo'lib o'qiladi; ular float32 da aniq saqlanadi
+            values = series.dropna()
+            if (values == values.round()).all() and values.abs().max() < 2 ** 24:
+                series = series.astype("float32")
+        elif (
+            pd.api.types.is_object_dtype(series.dtype)
+            or pd.api.types.is_string_dtype(series.dtype)
+        ) and len(series) > 0:
+            if series.nunique() <= category_max_ratio * len(series):
+                series = series.astype("category")
+        columns[col] = series
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+# path -> (dataset version, oddiy pd.read_csv hajmi)
+_source_bytes = {}
+
+
+def _plain_bytes(path):
+    # Taqqoslash asosi faqat hisobot so'ralganda, har bir fayl versiyasi
+    # uchun bir marta o'lchanadi
+    version = dataset_version(path)
+    cached = _source_bytes.get(path)
+    if cached is None or cached[0] != version:
+        cached = (version, frame_bytes(pd.read_csv(path)))
+        _source_bytes[path] = cached
+    return cached[1]
+
+
+def memory_report(names=None):
+    # Jarayon xotirasida ushlab turilgan frame'lar o'lchanadi (qayta
+    # yuklanmaydi va yangi nusxa keshlanmaydi). bytes_before - faylni
+    # parametrsiz pd.read_csv bilan o'qigandagi hajm.
+    paths = None if names is None else {data_path(name) for name in names}
+    rows = []
+    for (path, _), (_, df) in list(_frames.items()):
+        if paths is not None and path not in paths:
+            continue
+        after = frame_bytes(df)
+        before = _plain_bytes(path)
+        rows.append({
+            "table": os.path.basename(path),
+            "bytes_before": before,
+            "bytes_after": after,
+            "saved_pct": round((1 - after / before) * 100, 1) if before else 0.0,
+        })
+    return pd.DataFrame(
+        rows, columns=["table", "bytes_before", "bytes_after", "saved_pct"]
+    )
+
+
+def load_csv(name, transform=None, compact=False, **read_kwargs):
+    version = dataset_version(name)
+    options_key = _options_key(transform, compact, read_kwargs)
+    key = (data_path(name), options_key)
+
+    cached = _frames.get(key)
+    if cached is not None and cached[0] == version:
+        return shared_view(cached[1])
+
+    snapshot = _snapshot_path(name, version, options_key)
+    df = None
+    if os.path.exists(snapshot):
+        try:
+            df = _read_snapshot(snapshot)
+        except (OSError, ValueError):
+            df = None
+
+    if df is None:
+        df = pd.read_csv(data_path(name), **read_kwargs)
+        if transform is not None:
+            df = transform(df)
+        if compact:
+            df = compact_frame(df)
+        try:
+            _write_snapshot(df, snapshot)
+            _remove_stale_snapshots(name, snapshot)
+        except (OSError, ValueError, TypeError):
+            # Snapshot yozilmasa ham frame xotirada keshlanadi
+            pass
+
+    _frames[key] = (version, df)
+    return shared_view(df)
+
+
+# key -> (source versions, value)
+_derived = {}
+
+
+def derived(key, names, build):
+    # Manba fayllar versiyasi o'zgarmaguncha build() natijasi qayta ishlatiladi
+    versions = tuple(dataset_version(name) for name in names)
+    cached = _derived.get(key)
+    if cached is None or cached[0] != versions:
+        cached = (versions, build())
+        _derived[key] = cached
+    # Keshdagi frame'lar ham sessiyalarga faqat view sifatida beriladi
+    if isinstance(cached[1], (pd.DataFrame, pd.Series)):
+        return shared_view(cached[1])
+    return cached[1]
+
+
+# =========================
+# RESULT CACHE
+# =========================
+# Qimmat hisob natijalari (masalan, simulyatsiyalar) kalit bo'yicha
+# xotirada LRU tartibida saqlanadi; persist=True bo'lsa .data_cache/results
+# ichiga pickle sifatida ham yoziladi va ilova qayta ishga tushganda o'qiladi.
+
+RESULT_CACHE_SIZE = 32
+RESULT_DISK_FILES = 256
+RESULTS_DIR = os.path.join(CACHE_DIR, "results")
+
+# digest -> value (barcha sessiya oqimlari uchun umumiy, shuning uchun lock)
+_results = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def result_key(*parts):
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _result_path(namespace, digest):
+    return os.path.join(RESULTS_DIR, f"{namespace}.{digest}.pkl")
+
+
+def _prune_results(namespace):
+    prefix = f"{namespace}."
+    files = [
+        os.path.join(RESULTS_DIR, filename)
+        for filename in os.listdir(RESULTS_DIR)
+        if filename.startswith(prefix)
+    ]
+    files.sort(key=os.path.getmtime)
+    for path in files[:-RESULT_DISK_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def lookup_result(namespace, key, persist=False):
+    # Topilmasa None
+    digest = f"{namespace}.{key}"
+    with _results_lock:
+        if digest in _results:
+            _results.move_to_end(digest)
+            return _results[digest]
+
+    path = _result_path(namespace, key)
+    if not persist or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    _remember(digest, value)
+    return value
+
+
+def _remember(digest, value):
+    with _results_lock:
+        _results[digest] = value
+        _results.move_to_end(digest)
+        while len(_results) > RESULT_CACHE_SIZE:
+            _results.popitem(last=False)
+
+
+def store_result(namespace, key, value, persist=False):
+    _remember(f"{namespace}.{key}", value)
+    if not persist:
+        return
+    path = _result_path(namespace, key)
+    try:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        _prune_results(namespace)
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def cached_result(namespace, key, build, persist=False):
+    value = lookup_result(namespace, key, persist)
+    if value is None:
+        value = build()
+        store_result(namespace, key, value, persist)
+    return value
@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+from data_cache import derived
+from football_index import FOOTBALL_CSV, GROUP_COLUMNS, group_rows, load_football
+from player_data import PLAYER_TABLES, player_facts
+
+# =========================
+# FACET BITMAP INDEX
+# =========================
+# Har bir filtr ustunining har bir qiymati uchun bit-packed bitmap
+# (np.packbits) oldindan quriladi. Bitta facet ichida tanlangan qiymatlar
+# OR, facetlar orasida AND qilinadi; qolgan variantlar soni esa
+# bitmap & maska popcount'i orqali bitta vektorli amalda hisoblanadi.
+
+AGE_BINS = [0, 20, 24, 28, 32, 100]
+AGE_LABELS = ["<=20", "21-24", "25-28", "29-32", "33+"]
+
+PLAYER_FACETS = ["team", "field_position", "nationality", "age_band"]
+FOOTBALL_FACETS = ["Year", "Country", "League", "Club"]
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _popcount(bitmaps):
+    # numpy >= 2.0 da tayyor bitwise_count bor
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bitmaps).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT[bitmaps].sum(axis=-1, dtype=np.int64)
+
+
+def build_facet_index(df, columns):
+    facets = {}
+    for col in columns:
+        codes, values = pd.factorize(df[col], sort=True)
+        codes = np.asarray(codes)
+        bitmaps = np.empty((len(values), (len(df) + 7) // 8), dtype=np.uint8)
+        for i in range(len(values)):
+            bitmaps[i] = np.packbits(codes == i)
+        facets[col] = {"values": list(values), "bitmaps": bitmaps}
+    return {"size": len(df), "facets": facets}
+
+
+def _all_rows(index):
+    return np.packbits(np.ones(index["size"], dtype=bool))
+
+
+def facet_mask(index, selections, exclude=None):
+    mask = _all_rows(index)
+    for col, selected in selections.items():
+        if col == exclude or not selected:
+            continue
+        facet = index["facets"][col]
+        positions = [facet["values"].index(value) for value in selected]
+        mask &= np.bitwise_or.reduce(facet["bitmaps"][positions], axis=0)
+    return mask
+
+
+def facet_rows(index, selections):
+    mask = np.unpackbits(facet_mask(index, selections), count=index["size"])
+    return np.flatnonzero(mask)
+
+
+def facet_counts(index, selections):
+    # Har bir facet uchun soni - qolgan facetlar tanlovi bilan
+    counts = {}
+    for col, facet in index["facets"].items():
+        mask = facet_mask(index, selections, exclude=col)
+        totals = _popcount(facet["bitmaps"] & mask)
+        counts[col] = dict(zip(facet["values"], totals.tolist()))
+    return counts
+
+
+def facet_options(index, counts, selections, col):
+    # Boshqa filtrlar bilan kamida bitta qator qoladigan qiymatlar (va
+    # allaqachon tanlanganlari) - bo'sh natijali tanlov taklif qilinmaydi
+    selected = selections.get(col, [])
+    return [
+        value
+        for value in index["facets"][col]["values"]
+        if counts[col][value] > 0 or value in selected
+    ]
+
+
+def _player_facet_frame():
+    facts = player_facts([])
+    return facts.assign(
+        age_band=pd.cut(facts["age"], bins=AGE_BINS, labels=AGE_LABELS)
+    )
+
+
+def player_facets():
+    # Qator pozitsiyalari players_data.csv tartibida, player_leaderboard
+    # jadvallari bilan bir xil
+    files = [PLAYER_TABLES["players"]["file"], PLAYER_TABLES["teams"]["file"]]
+    return derived(
+        ("facets", "players"),
+        files,
+        lambda: build_facet_index(_player_facet_frame(), PLAYER_FACETS),
+    )
+
+
+def football_facets(name=FOOTBALL_CSV):
+    return derived(
+        ("facets", name),
+        [name],
+        lambda: build_facet_index(load_football(name), FOOTBALL_FACETS),
+    )
+
+
+def football_rows(selections, name=FOOTBALL_CSV):
+    # None - filtr tanlanmagan (get_top oldindan saralangan tartibdan
+    # foydalanadi). Faqat bittadan Year/League/Club tanlangan bo'lsa,
+    # tayyor guruh indeksidan O(guruh hajmi) bilan olinadi.
+    selected = {col: values for col, values in selections.items() if values}
+    if not selected:
+        return None
+    if set(selected) == set(GROUP_COLUMNS) and all(
+        len(values) == 1 for values in selected.values()
+    ):
+        return group_rows(*(selected[col][0] for col in GROUP_COLUMNS), name)
+    return facet_rows(football_facets(name), selections)
@@ -0,0 +1,34 @@
+import numpy as np
+
+from data_cache import derived, load_csv
+
+# =========================
+# FOOTBALL.CSV GROUP INDEX
+# =========================
+# (Year, League, Club) -> qatorlar pozitsiyalari. Indeks dataset
+# versiyasi uchun bir marta quriladi, bitta kombinatsiya tanlanganda
+# filtrlash O(guruh hajmi). Boshqa tanlovlar facet_filter.py dagi bitmap
+# indeksi orqali bajariladi.
+
+FOOTBALL_CSV = "Football.csv"
+GROUP_COLUMNS = ["Year", "League", "Club"]
+
+
+def load_football(name=FOOTBALL_CSV):
+    return load_csv(name, compact=True)
+
+
+def build_group_index(df):
+    return df.groupby(GROUP_COLUMNS, sort=False, observed=True).indices
+
+
+def group_index(name=FOOTBALL_CSV):
+    return derived(
+        ("group_index", name),
+        [name],
+        lambda: build_group_index(load_football(name)),
+    )
+
+
+def group_rows(year, league, club, name=FOOTBALL_CSV):
+    return group_index(name).get((year, league, club), np.empty(0, dtype=np.intp))
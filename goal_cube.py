@@ -0,0 +1,73 @@
+import pandas as pd
+
+from data_cache import derived
+from facet_filter import AGE_BINS, AGE_LABELS
+from player_data import PLAYER_TABLES, player_facts, table_columns
+
+# =========================
+# GOAL-TYPE CUBE
+# =========================
+# Gol turlari (inside_area, head, penalties_scored, ...) bitta groupby bilan
+# (team, field_position, nationality, age_band) bo'yicha yig'iladi. Roll-up'lar
+# (masalan, faqat team x field_position) xom jadvaldan emas, shu kichik
+# kubdan olinadi va har bir o'lchovlar to'plami uchun alohida keshlanadi.
+# Bo'sh o'lcham qiymatlari (masalan, AGE_BINS dan tashqari yosh) "Unknown"
+# guruhiga tushadi, shunda roll-up yig'indilari jadval bilan mos keladi.
+
+CUBE_DIMENSIONS = ["team", "field_position", "nationality", "age_band"]
+GOAL_MEASURES = table_columns("goals")
+
+UNKNOWN = "Unknown"
+
+_CUBE_FILES = [
+    PLAYER_TABLES[name]["file"] for name in ["players", "teams", "goals"]
+]
+
+
+def _fill_unknown(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if UNKNOWN not in series.cat.categories:
+            series = series.cat.add_categories(UNKNOWN)
+    return series.fillna(UNKNOWN)
+
+
+def build_goal_cube(facts):
+    facts = facts.assign(
+        age_band=pd.cut(facts["age"], bins=AGE_BINS, labels=AGE_LABELS)
+    )
+    facts = facts.assign(**{dim: _fill_unknown(facts[dim]) for dim in CUBE_DIMENSIONS})
+    grouped = facts.groupby(CUBE_DIMENSIONS, observed=True)
+    cube = grouped[GOAL_MEASURES].sum()
+    cube["players"] = grouped.size()
+    return cube
+
+
+def goal_cube():
+    return derived(
+        ("goal_cube", tuple(CUBE_DIMENSIONS)),
+        _CUBE_FILES,
+        lambda: build_goal_cube(player_facts(["goals"])),
+    )
+
+
+def goal_rollup(dimensions):
+    # dimensions - CUBE_DIMENSIONS ichidan ixtiyoriy qism, tartib saqlanadi
+    dimensions = tuple(dim for dim in CUBE_DIMENSIONS if dim in dimensions)
+    if dimensions == tuple(CUBE_DIMENSIONS):
+        return goal_cube()
+
+    def build():
+        cube = goal_cube()
+        if not dimensions:
+            return cube.sum().to_frame().T
+        return cube.groupby(level=list(dimensions), observed=True).sum()
+
+    return derived(("goal_cube", dimensions), _CUBE_FILES, build)
+
+
+def goal_slice(dimensions, filters=None):
+    # filters: {o'lcham: qiymat} - roll-up ichidan drill-down
+    rollup = goal_rollup(list(dimensions) + list(filters or {}))
+    for dim, value in (filters or {}).items():
+        rollup = rollup.xs(value, level=dim)
+    return rollup.reset_index()
@@ -0,0 +1,88 @@
+import numpy as np
+
+from data_cache import derived
+from football_index import FOOTBALL_CSV, load_football
+from player_data import (
+    PLAYER_COLUMNS,
+    PLAYER_TABLES,
+    player_facts,
+    table_columns,
+)
+
+# =========================
+# LEADERBOARD
+# =========================
+# Har bir sonli statistika uchun tartib (kamayish bo'yicha, NaN oxirida)
+# va har bir qatorning o'rni (rank) dataset versiyasi uchun bir marta
+# hisoblanadi. Top-N so'rovi saralash emas, tayyor massivdan kesish.
+
+# Jadvalda yo'q, lekin reytingda kerak bo'lgan statistikalar
+DERIVED_STATS = {
+    "disciplinary": {
+        "total_cards": lambda df: df["yellow_cards"] + df["red_cards"],
+    },
+}
+
+
+def build_leaderboard(df):
+    orders = {}
+    ranks = {}
+    for col in df.select_dtypes(include="number").columns:
+        values = df[col].to_numpy(dtype="float64", na_value=np.nan)
+        order = np.argsort(-values, kind="stable")
+        rank = np.empty(len(order), dtype=np.intp)
+        rank[order] = np.arange(len(order))
+        orders[col] = order
+        ranks[col] = rank
+    return {"frame": df, "orders": orders, "ranks": ranks}
+
+
+def filter_mask(df, filters):
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            mask &= df[col].isin(list(value)).to_numpy()
+        else:
+            mask &= (df[col] == value).to_numpy()
+    return mask
+
+
+def get_top(board, stat, n=10, filters=None, rows=None):
+    # rows - oldindan ma'lum qator pozitsiyalari (masalan, group index)
+    if rows is None and not filters:
+        return board["frame"].iloc[board["orders"][stat][:n]]
+
+    candidates = np.arange(len(board["frame"])) if rows is None else np.asarray(rows)
+    if filters:
+        candidates = candidates[filter_mask(board["frame"], filters)[candidates]]
+
+    rank = board["ranks"][stat][candidates]
+    if len(candidates) > n:
+        keep = np.argpartition(rank, n)[:n]
+        candidates, rank = candidates[keep], rank[keep]
+    return board["frame"].iloc[candidates[np.argsort(rank)]]
+
+
+def _player_board(table):
+    facts = player_facts([table])
+    df = facts[PLAYER_COLUMNS + table_columns(table)]
+    for col, compute in DERIVED_STATS.get(table, {}).items():
+        df = df.assign(**{col: compute(df)})
+    return build_leaderboard(df)
+
+
+def player_leaderboard(table):
+    files = [
+        PLAYER_TABLES["players"]["file"],
+        PLAYER_TABLES["teams"]["file"],
+        PLAYER_TABLES[table]["file"],
+    ]
+    return derived(("leaderboard", table), files, lambda: _player_board(table))
+
+
+def football_leaderboard(name=FOOTBALL_CSV):
+    return derived(
+        ("leaderboard", name),
+        [name],
+        lambda: build_leaderboard(load_football(name)),
+    )
@@ -0,0 +1,50 @@
+import pandas as pd
+
+from data_cache import load_csv
+
+# =========================
+# UCL MATCH INGEST
+# =========================
+# Matnli statistikalar ("1–3", "63%", "3 of 10") bir marta vektorli
+# str.extract bilan songa aylantiriladi va natija snapshotda keshlanadi.
+
+MATCHES_CSV = "ucl_2025_26_matches_with_goals.csv"
+
+SCORE_PATTERN = r"(\d+)\s*[–—-]\s*(\d+)"
+PERCENT_PATTERN = r"(\d+(?:\.\d+)?)\s*%"
+RATIO_PATTERN = r"(\d+)\s*of\s*(\d+)"
+
+
+def _extract_numbers(series, pattern):
+    return series.astype("string").str.extract(pattern).astype("float64")
+
+
+def parse_match_stats(df):
+    # Eksportdagi bo'sh qatorlar (jamoasiz) tashlab yuboriladi
+    df = df.dropna(subset=["home_team", "away_team"]).reset_index(drop=True)
+
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+
+    score = _extract_numbers(df["score"], SCORE_PATTERN)
+    df["home_goals"] = pd.to_numeric(df["home_goals"], errors="coerce").fillna(score[0])
+    df["away_goals"] = pd.to_numeric(df["away_goals"], errors="coerce").fillna(score[1])
+    df["total_goals"] = df["home_goals"] + df["away_goals"]
+
+    for side in ["home", "away"]:
+        df[f"{side}_possession"] = _extract_numbers(
+            df[f"{side}_possession"], PERCENT_PATTERN
+        )[0]
+
+        shots = _extract_numbers(df[f"{side}_shots_on_target"], RATIO_PATTERN)
+        df[f"{side}_shots_on_target"] = shots[0]
+        df[f"{side}_shots_total"] = shots[1]
+
+        saves = _extract_numbers(df[f"{side}_saves"], RATIO_PATTERN)
+        df[f"{side}_saves"] = saves[0]
+        df[f"{side}_saves_total"] = saves[1]
+
+    return df
+
+
+def load_matches(name=MATCHES_CSV):
+    return load_csv(name, transform=parse_match_stats)
@@ -0,0 +1,221 @@
+import threading
+
+from data_cache import dataset_version, load_csv, shared_view
+
+# =========================
+# UNIVERSAL COLUMN CLEANER
+# =========================
+def clean_column_name(name):
+    return (
+        name.strip()
+        .lower()
+        .replace(" ", "_")
+        .replace("-", "_")
+        .replace("(", "")
+        .replace(")", "")
+        .replace("%", "")
+    )
+
+
+def clean_columns(df):
+    # Faqat sarlavha o'zgaradi, ma'lumotlarga tegilmaydi
+    df.columns = [clean_column_name(col) for col in df.columns]
+    if df.index.name is not None:
+        df.index.name = clean_column_name(df.index.name)
+    return df
+
+
+# =========================
+# TABLE SCHEMAS
+# =========================
+# Har bir fayl uchun ustun turlari oldindan e'lon qilinadi va to'g'ridan-to'g'ri
+# read_csv ga beriladi. usecols = dtype kalitlari, shuning uchun e'lon
+# qilinmagan ustunlar (masalan, disciplinary dagi "Unnamed: 0") o'qilmaydi.
+# Statistikalar bo'sh qiymatga ega bo'lishi mumkin, shuning uchun float32.
+
+STAT = "float32"
+
+PLAYER_TABLES = {
+    "attacking": {
+        "file": "attacking_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "assists": STAT,
+            "corners_taken": STAT,
+            "offsides": STAT,
+            "dribbles": STAT,
+        },
+    },
+    "defending": {
+        "file": "defending_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "balls_recovered": STAT,
+            "tackles": STAT,
+            "tackles_won": STAT,
+            "tackles_lost": STAT,
+            "clearance_attempted": STAT,
+        },
+    },
+    "goalkeeping": {
+        "file": "goalkeeping_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "saves": STAT,
+            "goals_conceded": STAT,
+            "saves_on_penalty": STAT,
+            "clean_sheets": STAT,
+            "punches_made": STAT,
+        },
+    },
+    "goals": {
+        "file": "goals_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "goals": STAT,
+            "inside_area": STAT,
+            "outside_area": STAT,
+            "right_foot": STAT,
+            "left_foot": STAT,
+            "head": STAT,
+            "other": STAT,
+            "penalties_scored": STAT,
+        },
+    },
+    "disciplinary": {
+        "file": "disciplinary_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "fouls_committed": STAT,
+            "fouls_suffered": STAT,
+            "yellow_cards": STAT,
+            "red_cards": STAT,
+        },
+    },
+    "players": {
+        "file": "players_data.csv",
+        "index_col": "id_player",
+        "dtype": {
+            "id_player": "int32",
+            "player_name": "str",
+            "nationality": "category",
+            "field_position": "category",
+            "position": "category",
+            "weight(kg)": STAT,
+            "height(cm)": STAT,
+            "age": STAT,
+            "id_team": "int32",
+            "player_image": "str",
+        },
+    },
+    "teams": {
+        "file": "teams_data.csv",
+        "index_col": "team_id",
+        "dtype": {
+            "team_id": "int32",
+            "country": "category",
+            "team": "str",
+            "logo": "str",
+        },
+    },
+}
+
+
+# players/teams dan ilovalar o'qiydigan ustunlar. Sidebar facetlari (team,
+# field_position, nationality, age) va jamoa kubi barcha sahifalarda
+# kerak, shuning uchun ro'yxat sahifalar uchun umumiy. player_image / logo
+# URL ustunlari (eng katta satrlar), weight(kg) va position hech bir
+# sahifada ishlatilmaydi va o'qilmaydi.
+TABLE_USECOLS = {
+    "players": [
+        "player_name",
+        "nationality",
+        "field_position",
+        "age",
+        "height(cm)",
+        "id_team",
+    ],
+    "teams": ["country", "team"],
+}
+
+
+def load_table(name):
+    schema = PLAYER_TABLES[name]
+    usecols = [schema["index_col"]] + TABLE_USECOLS.get(
+        name, [col for col in schema["dtype"] if col != schema["index_col"]]
+    )
+    return load_csv(
+        schema["file"],
+        transform=clean_columns,
+        usecols=usecols,
+        dtype={col: schema["dtype"][col] for col in usecols},
+        index_col=schema["index_col"],
+    )
+
+
+# =========================
+# PLAYER FACT TABLE
+# =========================
+# players (+ teams, id_team -> team_id orqali) asosiga statistika
+# jadvallari id_player indeksi bo'yicha qo'shiladi. Jadvallar faqat biror
+# sahifa so'raganda yuklanadi va bir marta qo'shiladi, shuning uchun
+# "Goalkeepers" sahifasi faqat goalkeeping_data.csv uchun to'laydi.
+
+STAT_TABLES = ["attacking", "defending", "goalkeeping", "goals", "disciplinary"]
+PLAYER_FILES = [schema["file"] for schema in PLAYER_TABLES.values()]
+PLAYER_COLUMNS = ["player_name", "team", "nationality", "field_position"]
+
+_facts_lock = threading.Lock()
+
+# jadval nomi -> qo'shilgan paytdagi fayl versiyasi
+_facts = {"versions": {}, "frame": None}
+
+
+def table_columns(name):
+    schema = PLAYER_TABLES[name]
+    return [
+        clean_column_name(col)
+        for col in schema["dtype"]
+        if col != schema["index_col"]
+    ]
+
+
+def stat_columns():
+    # STAT_TABLES dagi barcha statistika ustunlari, jadval tartibida
+    return [col for table in STAT_TABLES for col in table_columns(table)]
+
+
+def _table_version(name):
+    return dataset_version(PLAYER_TABLES[name]["file"])
+
+
+def player_facts(tables=STAT_TABLES):
+    with _facts_lock:
+        versions = _facts["versions"]
+        frame = _facts["frame"]
+
+        base = {name: _table_version(name) for name in ["players", "teams"]}
+        if frame is None or any(versions.get(n) != v for n, v in base.items()):
+            frame = load_table("players").join(
+                load_table("teams"), on="id_team", how="left"
+            )
+            versions = base
+
+        for name in tables:
+            version = _table_version(name)
+            if versions.get(name) == version:
+                continue
+            # Fayl yangilangan bo'lsa, eski ustunlar almashtiriladi
+            frame = frame.drop(columns=table_columns(name), errors="ignore")
+            frame = frame.join(load_table(name), how="left")
+            versions[name] = version
+
+        _facts["versions"] = versions
+        _facts["frame"] = frame
+
+    return shared_view(frame)
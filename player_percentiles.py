@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from data_cache import derived
+from player_data import PLAYER_FILES, STAT_TABLES, player_facts, stat_columns
+
+# =========================
+# PERCENTILE TABLE
+# =========================
+# Har bir statistika uchun percentil (0-100) butun jadval bo'ylab yoki
+# field_position guruhi ichida bitta vektorli rank(pct=True) bilan
+# hisoblanadi. Natija dataset versiyasi uchun keshlanadi; o'yinchi tanlash
+# faqat tayyor matritsadan qator o'qiydi.
+
+POSITION_COLUMN = "field_position"
+
+RADAR_STATS = [
+    "goals",
+    "assists",
+    "dribbles",
+    "balls_recovered",
+    "tackles_won",
+    "saves",
+    "fouls_suffered",
+]
+
+
+def build_percentiles(df, columns, by=None):
+    values = df[columns]
+    if by is not None:
+        values = values.groupby(df[by], observed=True, dropna=False)
+    ranks = values.rank(pct=True, method="average") * 100
+    return ranks[columns].astype("float32")
+
+
+def player_percentiles(by_position=False):
+    # Qator pozitsiyalari players_data.csv tartibida (player_facts bilan bir xil)
+    by = POSITION_COLUMN if by_position else None
+    return derived(
+        ("percentiles", by),
+        PLAYER_FILES,
+        lambda: build_percentiles(player_facts(STAT_TABLES), stat_columns(), by),
+    )
+
+
+def radar_frame(percentiles, players, stats=RADAR_STATS):
+    # players: {nom: qator pozitsiyasi}
+    values = percentiles[stats].to_numpy()
+    return pd.DataFrame({
+        "player": np.repeat(list(players), len(stats)),
+        "stat": stats * len(players),
+        "percentile": np.nan_to_num(values[list(players.values())]).ravel(),
+    })
@@ -0,0 +1,129 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from data_cache import derived
+from football_index import FOOTBALL_CSV, load_football
+from player_data import PLAYER_TABLES, player_facts
+
+# =========================
+# PLAYER SEARCH INDEX
+# =========================
+# Ismlar normallashtiriladi (aksentlarsiz, kichik harf), so'ng ikki indeks
+# quriladi: tokenlar bo'yicha saralangan ro'yxat (prefiks qidiruv, bisect)
+# va trigram -> ism raqamlari. Indeks dataset versiyasi uchun bir marta
+# quriladi, har bir so'rov faqat tegishli ro'yxatlarni o'qiydi.
+
+PREFIX_BONUS = 1.0
+START_BONUS = 2.0
+
+
+def normalize_name(name):
+    text = unicodedata.normalize("NFKD", str(name))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return re.sub(r"[^0-9a-z]+", " ", text.lower()).strip()
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def build_search_index(names):
+    # Bir xil ism (masalan, turli mavsumlardagi qatorlar) bitta yozuvga
+    # birlashtiriladi; "rows" uning barcha qator pozitsiyalarini saqlaydi
+    codes, names = pd.factorize(pd.Series(names, dtype="object"))
+    # Ismi yo'q qatorlar (kod -1) indeksga kirmaydi
+    named = np.flatnonzero(codes >= 0)
+    order = named[np.argsort(codes[named], kind="stable")]
+    rows = np.split(order, np.cumsum(np.bincount(codes[named]))[:-1]) if len(names) else []
+
+    normalized = [normalize_name(name) for name in names]
+
+    tokens = []
+    trigrams = defaultdict(list)
+    for i, name in enumerate(normalized):
+        for token in set(name.split()):
+            tokens.append((token, i))
+        for trigram in _trigrams(name):
+            trigrams[trigram].append(i)
+
+    tokens.sort()
+    full_names = sorted((name, i) for i, name in enumerate(normalized))
+    return {
+        "names": list(names),
+        "rows": rows,
+        "tokens": [token for token, _ in tokens],
+        "token_ids": np.array([i for _, i in tokens], dtype=np.int64),
+        "full_names": [name for name, _ in full_names],
+        "full_name_ids": np.array([i for _, i in full_names], dtype=np.int64),
+        "trigrams": {
+            trigram: np.array(ids, dtype=np.int64)
+            for trigram, ids in trigrams.items()
+        },
+        "lengths": np.array([len(name) for name in normalized]),
+    }
+
+
+def _prefix_ids(keys, ids, prefix):
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\uffff", lo=start)
+    return ids[start:end]
+
+
+def search(index, query, limit=10):
+    query = normalize_name(query)
+    if not query:
+        return pd.DataFrame(columns=["name", "score", "rows"])
+
+    scores = np.zeros(len(index["names"]))
+
+    # Trigram o'xshashligi - xato yozilgan ismlar uchun
+    query_trigrams = _trigrams(query)
+    for trigram in query_trigrams:
+        ids = index["trigrams"].get(trigram)
+        if ids is not None:
+            scores[ids] += 1.0
+    scores /= len(query_trigrams)
+
+    # Har bir so'z biror token boshiga mos kelsa - bonus,
+    # to'liq ism so'rov bilan boshlansa - katta bonus
+    for token in query.split():
+        ids = _prefix_ids(index["tokens"], index["token_ids"], token)
+        scores[ids] += PREFIX_BONUS
+    ids = _prefix_ids(index["full_names"], index["full_name_ids"], query)
+    scores[ids] += START_BONUS
+
+    candidates = np.flatnonzero(scores)
+    if len(candidates) > limit:
+        keep = np.argpartition(-scores[candidates], limit)[:limit]
+        candidates = candidates[keep]
+    candidates = candidates[
+        np.lexsort((index["lengths"][candidates], -scores[candidates]))
+    ]
+    return pd.DataFrame({
+        "name": [index["names"][i] for i in candidates],
+        "score": scores[candidates].round(3),
+        "rows": [index["rows"][i] for i in candidates],
+    })
+
+
+def player_search_index():
+    # Pozitsiyalar players_data.csv tartibida (player_facts bilan bir xil)
+    return derived(
+        ("search", "players"),
+        [PLAYER_TABLES["players"]["file"]],
+        lambda: build_search_index(player_facts([])["player_name"]),
+    )
+
+
+def football_search_index(name=FOOTBALL_CSV):
+    return derived(
+        ("search", name),
+        [name],
+        lambda: build_search_index(load_football(name)["Player Names"]),
+    )
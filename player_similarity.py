@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+
+from data_cache import derived
+from football_index import FOOTBALL_CSV, load_football
+from player_data import PLAYER_FILES, STAT_TABLES, player_facts, stat_columns
+
+# =========================
+# SIMILAR PLAYERS
+# =========================
+# Statistikalar z-score bilan standartlashtiriladi (bo'sh qiymat = o'rtacha)
+# va bitta uzluksiz float32 matritsada saqlanadi. So'rov bitta
+# matritsa-vektor ko'paytmasi: |a-b|^2 = |a|^2 - 2ab + |b|^2, so'ng
+# argpartition bilan top-k.
+
+FOOTBALL_PER90 = ["Goals", "xG", "Shots", "OnTarget"]
+
+
+def build_similarity_index(df, columns):
+    values = df[columns].to_numpy(dtype="float64", na_value=np.nan)
+
+    # Hech qanday statistikasi yo'q o'yinchilar indeksga kirmaydi
+    valid = ~np.isnan(values).all(axis=1)
+    values = values[valid]
+
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    std[~(std > 0)] = 1.0
+    scaled = np.nan_to_num((values - np.nan_to_num(mean)) / std)
+
+    matrix = np.ascontiguousarray(scaled, dtype=np.float32)
+    return {
+        "matrix": matrix,
+        "norms": np.einsum("ij,ij->i", matrix, matrix),
+        "rows": np.flatnonzero(valid),
+        "columns": list(columns),
+    }
+
+
+def similar_players(index, row, k=10, rows=None):
+    # row - manba frame'dagi qator pozitsiyasi; rows berilsa (masalan,
+    # facet filtri), nomzodlar faqat shu pozitsiyalar orasidan olinadi
+    where = np.searchsorted(index["rows"], row)
+    if where >= len(index["rows"]) or index["rows"][where] != row:
+        return pd.DataFrame(columns=["position", "distance"])
+
+    matrix = index["matrix"]
+    distances = index["norms"] - 2 * (matrix @ matrix[where]) + index["norms"][where]
+    distances[where] = np.inf
+    if rows is not None:
+        distances[~np.isin(index["rows"], rows)] = np.inf
+
+    k = min(k, int(np.isfinite(distances).sum()))
+    if k <= 0:
+        return pd.DataFrame(columns=["position", "distance"])
+    nearest = np.argpartition(distances, k - 1)[:k]
+    nearest = nearest[np.argsort(distances[nearest])]
+    return pd.DataFrame({
+        "position": index["rows"][nearest],
+        "distance": np.sqrt(np.maximum(distances[nearest], 0)).round(3),
+    })
+
+
+def player_similarity_index():
+    # Pozitsiyalar players_data.csv tartibida (player_facts bilan bir xil)
+    return derived(
+        ("similarity", "players"),
+        PLAYER_FILES,
+        lambda: build_similarity_index(
+            player_facts(STAT_TABLES), stat_columns()
+        ),
+    )
+
+
+def _football_per90(df):
+    minutes = df["Mins"].where(df["Mins"] > 0)
+    return pd.DataFrame(
+        {f"{col} per 90": df[col] / minutes * 90 for col in FOOTBALL_PER90},
+        index=df.index,
+    )
+
+
+def football_similarity_index(name=FOOTBALL_CSV):
+    # Football.csv dagi o'yinchi-mavsum qatorlari, per-90 ko'rsatkichlar bo'yicha
+    def build():
+        per90 = _football_per90(load_football(name))
+        return build_similarity_index(per90, list(per90.columns))
+
+    return derived(("similarity", name), [name], build)
@@ -1,176 +1,339 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-
-st.set_page_config(page_title="Football Stats Analyzer", layout="wide")
-
-st.title(" Football Stats Analyzer Dashboard")
-
-
-# LOAD DATA
-
-@st.cache_data
-def load_data():
-    attacking = pd.read_csv("attacking_data.csv")
-    defending = pd.read_csv("defending_data.csv")
-    goalkeeping = pd.read_csv("goalkeeping_data.csv")
-    goals = pd.read_csv("goals_data.csv")
-    disciplinary = pd.read_csv("disciplinary_data.csv")
-    players = pd.read_csv("players_data.csv")
-    teams = pd.read_csv("teams_data.csv")
-    return attacking, defending, goalkeeping, goals, disciplinary, players, teams
-
-attacking, defending, goalkeeping, goals, disciplinary, players, teams = load_data()
-
-
-# SIDEBAR
-
-st.sidebar.header("Navigation")
-page = st.sidebar.selectbox(
-    "Choose Section",
-    [
-        "Home",
-        "Top Scorers",
-        "Playmakers",
-        "Defenders",
-        "Goalkeepers",
-        "Discipline",
-        "Team Comparison",
-    ],
-)
-
-
-# HOME
-
-if page == "Home":
-    st.subheader("Tournament Overview")
-
-    col1, col2, col3 = st.columns(3)
-
-    col1.metric("Total Teams", teams.shape[0])
-    col2.metric("Total Players", players.shape[0])
-    col3.metric("Total Goals", goals["goals"].sum())
-
-# TOP SCORERS
-
-elif page == "Top Scorers":
-    st.subheader("Top 10 Goal Scorers")
-
-    top_scorers = goals.sort_values("goals", ascending=False).head(10)
-
-    fig = px.bar(
-        top_scorers,
-        x="player_name",
-        y="goals",
-        color="goals",
-        title="Top 10 Scorers",
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    st.dataframe(top_scorers)
-
-
-# PLAYMAKERS
-
-elif page == "Playmakers":
-    st.subheader("Top 10 Assist Providers")
-
-    top_assist = attacking.sort_values("assists", ascending=False).head(10)
-
-    fig = px.bar(
-        top_assist,
-        x="player_name",
-        y="assists",
-        color="assists",
-        title="Top Assist Providers",
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    st.dataframe(top_assist)
-
-
-# DEFENDERS
-
-elif page == "Defenders":
-    st.subheader("Top Defensive Players (Tackles)")
-
-    top_def = defending.sort_values("tackles", ascending=False).head(10)
-
-    fig = px.bar(
-        top_def,
-        x="player_name",
-        y="tackles",
-        color="tackles",
-        title="Top Tacklers",
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    st.dataframe(top_def)
-
-
-# GOALKEEPERS
-
-elif page == "Goalkeepers":
-    st.subheader("Top Goalkeepers (Saves)")
-
-    top_gk = goalkeeping.sort_values("saves", ascending=False).head(10)
-
-    fig = px.bar(
-        top_gk,
-        x="player_name",
-        y="saves",
-        color="saves",
-        title="Top Goalkeepers",
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    st.dataframe(top_gk)
-
-
-# DISCIPLINE
-
-elif page == "Discipline":
-    st.subheader("Most Booked Players")
-
-    disciplinary["total_cards"] = (
-        disciplinary["yellow_cards"] + disciplinary["red_cards"]
-    )
-
-    top_cards = disciplinary.sort_values("total_cards", ascending=False).head(10)
-
-    fig = px.bar(
-        top_cards,
-        x="player_name",
-        y="total_cards",
-        color="total_cards",
-        title="Most Cards",
-    )
-    st.plotly_chart(fig, use_container_width=True)
-    st.dataframe(top_cards)
-
-
-# TEAM COMPARISON
-
-elif page == "Team Comparison":
-    st.subheader("Compare Two Teams")
-
-    team_list = teams["team_name"].unique()
-
-    team1 = st.selectbox("Select Team 1", team_list)
-    team2 = st.selectbox("Select Team 2", team_list)
-
-    team1_stats = teams[teams["team_name"] == team1]
-    team2_stats = teams[teams["team_name"] == team2]
-
-    comparison = pd.concat([team1_stats, team2_stats])
-
-    st.dataframe(comparison)
-
-    numeric_cols = comparison.select_dtypes(include="number").columns
-
-    fig = px.bar(
-        comparison,
-        x="team_name",
-        y=numeric_cols,
-        barmode="group",
-        title="Team Comparison",
-    )
-
-
-    st.plotly_chart(fig, use_container_width=True)
+import streamlit as st
+import numpy as np
+import plotly.express as px
+
+from data_cache import memory_report
+from facet_filter import facet_counts, facet_rows, player_facets
+from goal_cube import GOAL_MEASURES, goal_slice
+from leaderboard import get_top, player_leaderboard
+from player_data import (
+    PLAYER_COLUMNS,
+    PLAYER_FILES,
+    STAT_TABLES,
+    load_table,
+    player_facts,
+)
+from player_search import player_search_index, search
+from player_percentiles import RADAR_STATS, player_percentiles, radar_frame
+from player_similarity import player_similarity_index, similar_players
+from team_stats import TEAM_SUMS, compare_teams, team_stats
+
+st.set_page_config(page_title="Football Stats Analyzer", layout="wide")
+
+st.title(" Football Stats Analyzer Dashboard")
+
+
+# PAGES
+
+# Har bir sahifa o'ziga kerakli statistika jadvallarini e'lon qiladi
+PAGE_TABLES = {
+    "Home": ["goals"],
+    "Top Scorers": ["goals"],
+    "Playmakers": ["attacking"],
+    "Defenders": ["defending"],
+    "Goalkeepers": ["goalkeeping"],
+    "Discipline": ["disciplinary"],
+    "Team Comparison": [],
+    "Player Search": STAT_TABLES,
+    "Similar Players": STAT_TABLES,
+    "Player Comparison": STAT_TABLES,
+    "Goal Types": [],
+}
+
+
+# SIDEBAR
+
+st.sidebar.header("Navigation")
+page = st.sidebar.selectbox("Choose Section", list(PAGE_TABLES))
+
+
+# FILTERS
+
+# Bir nechta qiymat tanlash mumkin; qavsdagi son - boshqa filtrlar
+# bilan birga qolgan o'yinchilar soni
+FACET_LABELS = {
+    "team": "Team",
+    "field_position": "Position",
+    "nationality": "Nationality",
+    "age_band": "Age",
+}
+
+st.sidebar.header("Filters")
+
+facets = player_facets()
+selections = {col: st.session_state.get(f"facet_{col}", []) for col in FACET_LABELS}
+counts = facet_counts(facets, selections)
+
+for col, label in FACET_LABELS.items():
+    st.sidebar.multiselect(
+        label,
+        facets["facets"][col]["values"],
+        key=f"facet_{col}",
+        format_func=lambda value, col=col: f"{value} ({counts[col][value]})",
+    )
+
+rows = facet_rows(facets, selections) if any(selections.values()) else None
+
+
+# LOAD DATA
+
+# Faqat tanlangan sahifa jadvallari yuklanadi va player fact jadvaliga
+# qo'shiladi (player_data.py)
+def load_data(page):
+    return player_facts(PAGE_TABLES[page]), load_table("teams")
+
+facts, teams = load_data(page)
+
+
+# HOME
+
+if page == "Home":
+    st.subheader("Tournament Overview")
+
+    col1, col2, col3 = st.columns(3)
+
+    selected = facts if rows is None else facts.iloc[rows]
+
+    col1.metric("Total Teams", teams.shape[0])
+    col2.metric("Total Players", selected.shape[0])
+    col3.metric("Total Goals", selected["goals"].sum())
+
+    # Faqat shu jarayonda yuklangan jadvallar ko'rsatiladi
+    with st.expander("Memory usage"):
+        st.dataframe(memory_report(PLAYER_FILES))
+
+# TOP SCORERS
+
+elif page == "Top Scorers":
+    st.subheader("Top 10 Goal Scorers")
+
+    top_scorers = get_top(player_leaderboard("goals"), "goals", rows=rows)
+
+    fig = px.bar(
+        top_scorers,
+        x="player_name",
+        y="goals",
+        color="goals",
+        title="Top 10 Scorers",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(top_scorers)
+
+
+# PLAYMAKERS
+
+elif page == "Playmakers":
+    st.subheader("Top 10 Assist Providers")
+
+    top_assist = get_top(player_leaderboard("attacking"), "assists", rows=rows)
+
+    fig = px.bar(
+        top_assist,
+        x="player_name",
+        y="assists",
+        color="assists",
+        title="Top Assist Providers",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(top_assist)
+
+
+# DEFENDERS
+
+elif page == "Defenders":
+    st.subheader("Top Defensive Players (Tackles)")
+
+    top_def = get_top(player_leaderboard("defending"), "tackles", rows=rows)
+
+    fig = px.bar(
+        top_def,
+        x="player_name",
+        y="tackles",
+        color="tackles",
+        title="Top Tacklers",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(top_def)
+
+
+# GOALKEEPERS
+
+elif page == "Goalkeepers":
+    st.subheader("Top Goalkeepers (Saves)")
+
+    top_gk = get_top(player_leaderboard("goalkeeping"), "saves", rows=rows)
+
+    fig = px.bar(
+        top_gk,
+        x="player_name",
+        y="saves",
+        color="saves",
+        title="Top Goalkeepers",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(top_gk)
+
+
+# DISCIPLINE
+
+elif page == "Discipline":
+    st.subheader("Most Booked Players")
+
+    top_cards = get_top(player_leaderboard("disciplinary"), "total_cards", rows=rows)
+
+    fig = px.bar(
+        top_cards,
+        x="player_name",
+        y="total_cards",
+        color="total_cards",
+        title="Most Cards",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(top_cards)
+
+
+# TEAM COMPARISON
+
+elif page == "Team Comparison":
+    st.subheader("Compare Two Teams")
+
+    # Jamoa ko'rsatkichlari oldindan yig'ilgan (team_stats.py)
+    cube = team_stats()
+    team_list = list(cube.index)
+
+    team1 = st.selectbox("Select Team 1", team_list)
+    team2 = st.selectbox("Select Team 2", team_list, index=1)
+
+    comparison = compare_teams(cube, team1, team2)
+
+    st.dataframe(comparison)
+
+    fig = px.bar(
+        comparison,
+        x="team",
+        y=TEAM_SUMS,
+        barmode="group",
+        title="Team Comparison",
+    )
+
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# PLAYER SEARCH
+
+elif page == "Player Search":
+    st.subheader("Find a Player")
+
+    query = st.text_input("Player name")
+
+    if query:
+        matches = search(player_search_index(), query)
+
+        if matches.empty:
+            st.warning("No players found.")
+        else:
+            st.dataframe(facts.iloc[np.concatenate(matches["rows"].tolist())])
+
+
+# SIMILAR PLAYERS
+
+elif page == "Similar Players":
+    st.subheader("Similar Players")
+
+    player = st.selectbox(
+        "Player",
+        range(len(facts)),
+        format_func=lambda i: f"{facts['player_name'].iat[i]} ({facts['team'].iat[i]})",
+    )
+    k = st.slider("Number of players", 5, 30, 10)
+
+    similar = similar_players(player_similarity_index(), player, k=k, rows=rows)
+
+    if similar.empty:
+        st.warning("No comparable players found.")
+    else:
+        result = facts.iloc[similar["position"]][PLAYER_COLUMNS].assign(
+            distance=similar["distance"].to_numpy()
+        )
+        st.dataframe(result)
+
+
+# PLAYER COMPARISON
+
+elif page == "Player Comparison":
+    st.subheader("Player vs Player (percentiles)")
+
+    def player_label(i):
+        return f"{facts['player_name'].iat[i]} ({facts['team'].iat[i]})"
+
+    col1, col2 = st.columns(2)
+    player1 = col1.selectbox("Player 1", range(len(facts)), format_func=player_label)
+    player2 = col2.selectbox("Player 2", range(len(facts)), index=1, format_func=player_label)
+
+    by_position = st.checkbox("Compare within position group")
+    stats = st.multiselect("Stats", list(player_percentiles().columns), default=RADAR_STATS)
+
+    if len(stats) < 3:
+        st.warning("Select at least 3 stats.")
+    else:
+        radar = radar_frame(
+            player_percentiles(by_position),
+            {player_label(player1): player1, player_label(player2): player2},
+            stats,
+        )
+        fig = px.line_polar(
+            radar,
+            r="percentile",
+            theta="stat",
+            color="player",
+            line_close=True,
+            range_r=[0, 100],
+        )
+        fig.update_traces(fill="toself")
+        st.plotly_chart(fig, use_container_width=True)
+
+
+# GOAL TYPES
+
+elif page == "Goal Types":
+    st.subheader("Goal Types Breakdown")
+
+    # Grafiklar oldindan yig'ilgan gol kubidan olinadi (goal_cube.py)
+    DIMENSION_LABELS = {
+        "team": "Team",
+        "field_position": "Position",
+        "nationality": "Nationality",
+        "age_band": "Age",
+    }
+
+    col1, col2, col3 = st.columns(3)
+    group_by = col1.selectbox("Group by", list(DIMENSION_LABELS), format_func=DIMENSION_LABELS.get)
+    split_options = [None] + [dim for dim in DIMENSION_LABELS if dim != group_by]
+    split_by = col2.selectbox(
+        "Split by",
+        split_options,
+        index=split_options.index("field_position") if "field_position" in split_options else 0,
+        format_func=lambda dim: DIMENSION_LABELS.get(dim, "None"),
+    )
+    measure = col3.selectbox("Goal type", GOAL_MEASURES, index=GOAL_MEASURES.index("head"))
+
+    filters = {}
+    if group_by != "team" and split_by != "team":
+        team = st.selectbox("Team", ["All"] + sorted(facts["team"].dropna().unique()))
+        if team != "All":
+            filters["team"] = team
+
+    dimensions = [group_by] + ([split_by] if split_by else [])
+    breakdown = goal_slice(dimensions, filters)
+
+    fig = px.bar(
+        breakdown,
+        x=group_by,
+        y=measure,
+        color=split_by,
+        barmode="stack",
+        title=f"{measure} by {DIMENSION_LABELS[group_by]}",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(breakdown)
@@ -0,0 +1,497 @@
+import hashlib
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from data_cache import cached_result, code_hash, lookup_result, result_key, store_result
+
+# =========================
+# TOURNAMENT SIMULATION
+# =========================
+# chempion2.py dagi Monte Carlo modeli, lekin har bir simulyatsiya va
+# o'yin uchun Python sikli o'rniga butun partiya (n_sims x n_matches)
+# massivlarda o'ynaladi. Model o'zgarmagan:
+#   - jamoa kuchi = o'rtacha urilgan - o'rtacha o'tkazilgan gol
+#     (uy va safar o'rtachalarining o'rtachasi), lambda = max(kuch + 1.5, 0.2)
+#   - jamoalar tasodifiy aralashtiriladi va ketma-ket juftlanadi,
+#     toq sonli raundda oxirgi jamoa chiqib ketadi
+#   - durangda g'olib tanga tashlash bilan aniqlanadi
+
+BASE_GOALS = 1.5
+MIN_LAMBDA = 0.2
+
+# Bitta partiyadagi simulyatsiyalar soni (xotira chegarasi)
+BATCH_SIZE = 100_000
+
+# Bitta simulyatsiya uchun protsesslar chegarasi (server sozlamasi): ko'p
+# sessiyali serverda har bir sessiya barcha yadrolarni egallamasligi uchun
+MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# Workerlar fork bilan emas, toza jarayondan ishga tushiriladi: ko'p oqimli
+# Streamlit serverini fork qilish boshqa oqim ushlab turgan lock'da qotib
+# qolishi mumkin
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Seed berilgan natijalar xotirada (LRU) va diskda keshlanadi
+PERSIST_RESULTS = True
+
+# Kalitga model kodi hashi kiradi: play_round, team_strengths va h.k.
+# o'zgarsa diskdagi eski natijalar ishlatilmaydi. RESULT_VERSION - kod
+# hashi ushlamaydigan o'zgarishlar uchun qo'lda oshiriladi.
+RESULT_VERSION = 1
+
+
+def _model_version():
+    return RESULT_VERSION, code_hash(sys.modules[__name__])
+
+MODEL_COLUMNS = ["home_team", "away_team", "home_goals", "away_goals"]
+
+
+def data_hash(df):
+    # Faqat modelga kiradigan ustunlar (team_strengths) hashlanadi
+    hashes = pd.util.hash_pandas_object(df[MODEL_COLUMNS], index=False).to_numpy()
+    return hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def team_strengths(df):
+    teams = sorted(set(df["home_team"]).union(set(df["away_team"])))
+
+    def side_mean(team_col, goals_col):
+        return df.groupby(team_col)[goals_col].mean().reindex(teams, fill_value=0)
+
+    attack = (side_mean("home_team", "home_goals") + side_mean("away_team", "away_goals")) / 2
+    defense = (side_mean("home_team", "away_goals") + side_mean("away_team", "home_goals")) / 2
+    return (attack - defense).rename("Strength").rename_axis("Team")
+
+
+def match_lambdas(strengths, base_goals=BASE_GOALS, min_lambda=MIN_LAMBDA):
+    return np.maximum(np.asarray(strengths, dtype="float64") + base_goals, min_lambda)
+
+
+def play_round(current, lambdas, rng):
+    # current: (n_sims, n_teams) jamoa kodlari; juftlar (0,1), (2,3), ...
+    pairs = current.shape[1] // 2
+    team1 = current[:, 0:2 * pairs:2]
+    team2 = current[:, 1:2 * pairs:2]
+
+    goals1 = rng.poisson(lambdas[team1])
+    goals2 = rng.poisson(lambdas[team2])
+    coin = rng.random(goals1.shape) < 0.5
+
+    first_wins = (goals1 > goals2) | ((goals1 == goals2) & coin)
+    return np.where(first_wins, team1, team2)
+
+
+def simulate_batch(lambdas, n_sims, rng, bracket=None):
+    # bracket - belgilangan qur'a (jamoa kodlari tartibi); None - tasodifiy
+    n_teams = len(lambdas)
+    if bracket is None:
+        codes = np.arange(n_teams, dtype=np.int16)
+        current = rng.permuted(np.broadcast_to(codes, (n_sims, n_teams)), axis=1)
+    else:
+        current = np.broadcast_to(np.asarray(bracket, dtype=np.int16), (n_sims, len(bracket)))
+
+    while current.shape[1] > 1:
+        current = play_round(current, lambdas, rng)
+
+    return np.bincount(current[:, 0], minlength=n_teams)
+
+
+def simulate_champions(lambdas, n_sims, rng=None, batch_size=BATCH_SIZE, bracket=None):
+    rng = np.random.default_rng(rng)
+    counts = np.zeros(len(lambdas), dtype=np.int64)
+    for start in range(0, n_sims, batch_size):
+        counts += simulate_batch(lambdas, min(batch_size, n_sims - start), rng, bracket)
+    return counts
+
+
+# =========================
+# PARALLEL RUNNER
+# =========================
+# Ish CHUNK_SIZE simulyatsiyali bo'laklarga bo'linadi; i-bo'lak doim
+# SeedSequence(seed).spawn() ning i-bolasidan foydalanadi va natijalar
+# bo'laklar tartibida qo'shiladi. Shuning uchun natija (to'xtash nuqtasi
+# ham) worker soniga bog'liq emas. Har bir bo'lakdan keyin har bir jamoa
+# ehtimolining Wilson ishonch oralig'i tekshiriladi.
+
+CHUNK_SIZE = 50_000
+Z_95 = 1.96
+
+
+def wilson_interval(counts, n, z=Z_95):
+    p = counts / n
+    denom = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return center - half, center + half
+
+
+def _run_chunk(lambdas, n_sims, seed_seq, bracket=None):
+    return simulate_champions(
+        lambdas, n_sims, np.random.default_rng(seed_seq), bracket=bracket
+    )
+
+
+def _summary(counts, n, max_sims, started, converged, entropy, z):
+    seconds = time.perf_counter() - started
+    low, high = wilson_interval(counts, n, z)
+    return {
+        "counts": counts.copy(),
+        "n_sims": n,
+        "max_sims": max_sims,
+        "seconds": seconds,
+        "sims_per_sec": n / seconds if seconds > 0 else float("inf"),
+        "ci_low": low,
+        "ci_high": high,
+        "ci_width": float((high - low).max()),
+        "converged": converged,
+        "complete": converged or n >= max_sims,
+        "entropy": entropy,
+    }
+
+
+def iter_champions(lambdas, max_sims, seed=None, workers=None,
+                   ci_width=None, chunk_size=CHUNK_SIZE, z=Z_95, bracket=None):
+    # Har bir bo'lakdan keyin oraliq natija (joriy ehtimollar va CI) beriladi.
+    # Generator yopilsa (bekor qilish), navbatdagi bo'laklar bekor qilinadi.
+    # ci_width - ehtimollik ulushida (0.01 = 1 foiz punkti); None - to'xtamaslik
+    root = np.random.SeedSequence(seed)
+    sizes = [min(chunk_size, max_sims - start) for start in range(0, max_sims, chunk_size)]
+    seeds = root.spawn(len(sizes))
+    # Bo'laklar sonidan ko'p jarayon ochilmaydi; bitta bo'lsa jarayonning o'zida
+    workers = max(1, min(workers or MAX_WORKERS, MAX_WORKERS, len(sizes)))
+
+    counts = np.zeros(len(lambdas), dtype=np.int64)
+    n = 0
+    started = time.perf_counter()
+
+    executor = ProcessPoolExecutor(workers, mp_context=_MP_CONTEXT) if workers > 1 else None
+    try:
+        for wave in range(0, len(sizes), workers):
+            chunk_sizes = sizes[wave:wave + workers]
+            chunk_seeds = seeds[wave:wave + workers]
+            if executor is None:
+                results = (
+                    _run_chunk(lambdas, size, ss, bracket)
+                    for size, ss in zip(chunk_sizes, chunk_seeds)
+                )
+            else:
+                n_chunks = len(chunk_sizes)
+                results = executor.map(
+                    _run_chunk, [lambdas] * n_chunks, chunk_sizes, chunk_seeds, [bracket] * n_chunks
+                )
+
+            # Bo'laklar tartib bilan qo'shiladi; to'xtash nuqtasidan keyingilari tashlanadi
+            for size, chunk_counts in zip(chunk_sizes, results):
+                counts += chunk_counts
+                n += size
+                converged = False
+                if ci_width is not None:
+                    low, high = wilson_interval(counts, n, z)
+                    converged = bool((high - low).max() <= ci_width)
+                yield _summary(counts, n, max_sims, started, converged, root.entropy, z)
+                if converged:
+                    return
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def probability_table(teams, result):
+    table = pd.DataFrame({
+        "Probability %": result["counts"] / result["n_sims"] * 100,
+        "CI low %": result["ci_low"] * 100,
+        "CI high %": result["ci_high"] * 100,
+    }, index=pd.Index(teams, name="Team"))
+    table = table[result["counts"] > 0]
+    return table.sort_values("Probability %", ascending=False)
+
+
+def stream_simulation(df, max_sims, seed=None, workers=None, ci_width=None, bracket=None,
+                      base_goals=BASE_GOALS, min_lambda=MIN_LAMBDA):
+    # bracket - jamoa nomlari tartibi (belgilangan setka); None - tasodifiy qur'a.
+    # Natija worker soniga bog'liq emas, shuning uchun u kalitga kirmaydi;
+    # seed=None natijalari takrorlanmaydi va keshlanmaydi. Faqat oxirigacha
+    # yetgan natija keshlanadi, bekor qilingan oraliq natija emas.
+    key = None
+    if seed is not None:
+        key = result_key(
+            _model_version(),
+            data_hash(df),
+            base_goals,
+            min_lambda,
+            max_sims,
+            seed,
+            ci_width,
+            None if bracket is None else tuple(bracket),
+            CHUNK_SIZE,
+        )
+        cached = lookup_result("simulation", key, persist=PERSIST_RESULTS)
+        if cached is not None:
+            yield cached
+            return
+
+    strengths = team_strengths(df)
+    codes = None if bracket is None else strengths.index.get_indexer(bracket)
+
+    result = None
+    for result in iter_champions(
+        match_lambdas(strengths, base_goals, min_lambda),
+        max_sims,
+        seed=seed,
+        workers=workers,
+        ci_width=ci_width,
+        bracket=codes,
+    ):
+        result["table"] = probability_table(strengths.index, result)
+        yield result
+
+    if key is not None and result is not None:
+        store_result("simulation", key, result, persist=PERSIST_RESULTS)
+
+
+# =========================
+# EXACT BRACKET
+# =========================
+# Model faqat har bir jamoa uchun Poisson(lambda), shuning uchun
+# P(i j ni yengadi) = P(g_i > g_j) + 0.5 * P(g_i == g_j) aniq hisoblanadi
+# (kesilgan Poisson taqsimotlari konvolyutsiyasi). Belgilangan setka
+# bo'ylab chempionlik ehtimoli dinamik dasturlash bilan tarqatiladi:
+# har bir tugun uchun "bu tugunni t jamoa yutadi" vektori. Tasodifiy
+# qur'a bo'yicha o'rtachaning yopiq formulasi yo'q, shuning uchun aniq
+# rejim faqat belgilangan setka uchun; sampler ham shu setkani qabul qiladi
+# va natijani tekshirish uchun ishlatiladi.
+
+# Poisson dumining (hisobga olinmaydigan qism) yuqori chegarasi
+TAIL_SIGMAS = 12
+
+
+def poisson_pmf(lambdas, max_goals=None):
+    lambdas = np.asarray(lambdas, dtype="float64")
+    if max_goals is None:
+        top = lambdas.max()
+        max_goals = int(np.ceil(top + TAIL_SIGMAS * np.sqrt(top))) + 10
+    goals = np.arange(max_goals + 1)
+    log_factorial = np.concatenate([[0.0], np.cumsum(np.log(goals[1:]))])
+    pmf = np.exp(goals * np.log(lambdas[:, None]) - lambdas[:, None] - log_factorial)
+    return pmf / pmf.sum(axis=1, keepdims=True)
+
+
+def win_matrix(lambdas):
+    # W[i, j] = P(i j ni yengadi), durangda tanga: W + W.T = 1
+    pmf = poisson_pmf(lambdas)
+    below = np.cumsum(pmf, axis=1) - pmf  # P(g < k)
+    return pmf @ below.T + 0.5 * (pmf @ pmf.T)
+
+
+def exact_champions(win, bracket):
+    # current[s, t] = s-o'rindagi tugunni t jamoa yutish ehtimoli
+    current = np.eye(len(win))[np.asarray(bracket)]
+    while len(current) > 1:
+        pairs = len(current) // 2
+        first = current[0:2 * pairs:2]
+        second = current[1:2 * pairs:2]
+        current = first * (second @ win.T) + second * (first @ win.T)
+    return current[0]
+
+
+def seeded_bracket(ranking):
+    # 1-o'rin oxirgi bilan, 2-o'rin oxiridan bitta oldingi bilan, ...
+    ranking = list(ranking)
+    order = []
+    while ranking:
+        order.append(ranking.pop(0))
+        if ranking:
+            order.append(ranking.pop())
+    return order
+
+
+def exact_probabilities(df, bracket_teams):
+    strengths = team_strengths(df)
+    bracket = strengths.index.get_indexer(bracket_teams)
+    probs = exact_champions(win_matrix(match_lambdas(strengths)), bracket)
+    table = pd.DataFrame(
+        {"Probability %": probs * 100}, index=pd.Index(strengths.index, name="Team")
+    )
+    table = table[probs > 0]
+    return table.sort_values("Probability %", ascending=False)
+
+
+# =========================
+# VARIANCE REDUCTION
+# =========================
+# "What if" ssenariylarini solishtirish uchun gollar teskari CDF orqali
+# uniform sonlardan olinadi, shuning uchun:
+#   - common random numbers: barcha ssenariylar bir xil qur'a, uniformlar
+#     va tangalarni ishlatadi (farq shovqini keskin kamayadi)
+#   - antithetic: har bir simulyatsiya u va 1-u bilan juft o'ynaladi
+#   - stratified: bitta tasodifiy qur'aning n_teams ta siklik siljishi -
+#     har bir jamoa har bir setka o'rnida aynan bir marta bo'ladi
+# Mustaqil birlik - blok (strata x antithetic juft); dispersiya va
+# effective sample size (ESS) bloklar bo'yicha baholanadi.
+
+
+def _flat_cdf(lambdas):
+    # Jamoa t ning CDF qiymatlari [t, t + 1] oralig'iga suriladi, shunda
+    # bitta searchsorted barcha jamoalar uchun ishlaydi
+    cdf = np.cumsum(poisson_pmf(lambdas), axis=1)
+    cdf[:, -1] = 1.0
+    return (cdf + np.arange(len(cdf))[:, None]).ravel(), cdf.shape[1]
+
+
+def _inverse_poisson(flat_cdf, width, teams, u):
+    goals = np.searchsorted(flat_cdf, teams + u, side="right") - teams * width
+    return np.minimum(goals, width - 1)
+
+
+def _draw_inputs(rng, n_blocks, n_teams, strata, antithetic, bracket):
+    # Bitta partiya uchun barcha tasodifiy kirishlar: qur'a va har bir
+    # raund uchun (u1, u2, tanga) uniformlari. Shakl: (n_blocks, block_size, ...)
+    copies = 2 if antithetic else 1
+
+    if bracket is not None:
+        slots = np.broadcast_to(np.asarray(bracket, dtype=np.int64), (n_blocks, 1, len(bracket)))
+    else:
+        codes = np.arange(n_teams)
+        slots = rng.permuted(np.broadcast_to(codes, (n_blocks, n_teams)), axis=1)[:, None, :]
+        if strata > 1:
+            slots = (slots + np.arange(strata)[None, :, None]) % n_teams
+    slots = np.repeat(slots, copies, axis=1)
+
+    rounds = []
+    width = slots.shape[2]
+    while width > 1:
+        pairs = width // 2
+        draws = rng.random((3, n_blocks, strata, 1, pairs))
+        if antithetic:
+            draws = np.concatenate([draws, 1 - draws], axis=3)
+        rounds.append(draws.reshape(3, n_blocks, strata * copies, pairs))
+        width = pairs
+    return slots, rounds
+
+
+def _play_inputs(slots, rounds, flat_cdf, width):
+    current = slots
+    for u1, u2, coin in rounds:
+        pairs = current.shape[2] // 2
+        team1 = current[:, :, 0:2 * pairs:2]
+        team2 = current[:, :, 1:2 * pairs:2]
+        goals1 = _inverse_poisson(flat_cdf, width, team1, u1)
+        goals2 = _inverse_poisson(flat_cdf, width, team2, u2)
+        first_wins = (goals1 > goals2) | ((goals1 == goals2) & (coin < 0.5))
+        current = np.where(first_wins, team1, team2)
+    return current[:, :, 0]
+
+
+def _block_fractions(champions, n_teams):
+    # champions: (n_blocks, block_size) -> har bir blokda jamoalar g'alaba ulushi
+    n_blocks, block_size = champions.shape
+    block = np.repeat(np.arange(n_blocks), block_size)
+    wins = np.bincount(block * n_teams + champions.ravel(), minlength=n_blocks * n_teams)
+    return wins.reshape(n_blocks, n_teams) / block_size
+
+
+def _simulate_scenarios(scenarios, n_sims, seed, antithetic, stratified, common, bracket,
+                        batch_size):
+    cdfs = [_flat_cdf(lambdas) for lambdas in scenarios]
+    n_teams = len(scenarios[0])
+    n_scenarios = len(scenarios)
+
+    strata = n_teams if stratified and bracket is None else 1
+    block_size = strata * (2 if antithetic else 1)
+    n_blocks_total = max(-(-n_sims // block_size), 2)
+
+    rngs = [
+        np.random.default_rng(ss)
+        for ss in np.random.SeedSequence(seed).spawn(1 if common else n_scenarios)
+    ]
+
+    # Blok ulushlarining yig'indisi va kvadratlari yig'indisi
+    total = np.zeros((n_scenarios, n_teams))
+    total_sq = np.zeros((n_scenarios, n_teams))
+    diff_sq = np.zeros((n_scenarios, n_teams))
+
+    blocks_per_batch = max(batch_size // block_size, 1)
+    for start in range(0, n_blocks_total, blocks_per_batch):
+        n_blocks = min(blocks_per_batch, n_blocks_total - start)
+        inputs = None
+        fractions = []
+        for i, (flat_cdf, width) in enumerate(cdfs):
+            if inputs is None or not common:
+                inputs = _draw_inputs(
+                    rngs[0 if common else i], n_blocks, n_teams, strata, antithetic, bracket
+                )
+            champions = _play_inputs(*inputs, flat_cdf, width)
+            fractions.append(_block_fractions(champions, n_teams))
+
+        fractions = np.stack(fractions)
+        total += fractions.sum(axis=1)
+        total_sq += (fractions ** 2).sum(axis=1)
+        diff_sq += ((fractions - fractions[0]) ** 2).sum(axis=1)
+
+    nb = n_blocks_total
+    probs = total / nb
+    var_mean = np.maximum(total_sq / nb - probs ** 2, 0) / (nb - 1)
+    diff = probs - probs[0]
+    diff_var_mean = np.maximum(diff_sq / nb - diff ** 2, 0) / (nb - 1)
+
+    # ESS: oddiy (mustaqil) Monte Carlo shu aniqlikka erishishi uchun kerak
+    # bo'lgan simulyatsiyalar soni
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ess = probs * (1 - probs) / var_mean
+        # Mustaqil ikki yugurishdagi farq dispersiyasi / CRN farq dispersiyasi
+        diff_gain = (var_mean + var_mean[0]) / diff_var_mean
+
+    return {
+        "n_sims": nb * block_size,
+        "probs": probs,
+        "stderr": np.sqrt(var_mean),
+        "ess": ess,
+        "diff": diff,
+        "diff_stderr": np.sqrt(diff_var_mean),
+        "diff_gain": diff_gain,
+    }
+
+
+def ess_summary(result, scenario=0):
+    # Ehtimoli > 0 bo'lgan jamoalar bo'yicha ESS / n_sims mediani
+    probs = result["probs"][scenario]
+    ess = result["ess"][scenario][(probs > 0) & np.isfinite(result["ess"][scenario])]
+    if len(ess) == 0:
+        return float("nan")
+    return float(np.median(ess) / result["n_sims"])
+
+
+def simulate_scenarios(scenarios, n_sims, seed=None, antithetic=True, stratified=True,
+                       common=True, bracket=None, batch_size=BATCH_SIZE):
+    # scenarios: lambda vektorlari ro'yxati (bir xil jamoalar tartibida);
+    # farqlar birinchi ssenariyga nisbatan. Lambdalar ma'lumot va model
+    # parametrlarini to'liq aniqlaydi, shuning uchun kalit ulardan olinadi
+    scenarios = [np.asarray(lambdas, dtype="float64") for lambdas in scenarios]
+
+    def build():
+        return _simulate_scenarios(
+            scenarios, n_sims, seed, antithetic, stratified, common, bracket, batch_size
+        )
+
+    if seed is None:
+        return build()
+    key = result_key(
+        _model_version(),
+        [lambdas.tobytes() for lambdas in scenarios],
+        n_sims,
+        seed,
+        antithetic,
+        stratified,
+        common,
+        None if bracket is None else tuple(np.asarray(bracket).tolist()),
+        batch_size,
+    )
+    return cached_result("scenarios", key, build, persist=PERSIST_RESULTS)
@@ -0,0 +1,346 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from data_cache import CACHE_DIR, derived
+from match_data import MATCHES_CSV, load_matches
+
+# =========================
+# STANDINGS ENGINE
+# =========================
+# Jamoalar bir marta factorize qilinadi, so'ng har bir ko'rsatkich
+# (o'yin, G/D/M, urilgan/o'tkazilgan gollar) np.bincount bilan butun match
+# jadvali bo'ylab bitta vektorli amalda yig'iladi. Tartib UEFA league phase
+# qoidalari bo'yicha: ochko, to'p farqi, urilgan gollar, safardagi gollar,
+# g'alabalar, safardagi g'alabalar, raqiblar ochkosi / to'p farqi / gollari.
+# Disiplinar ball va UEFA koeffitsienti ma'lumotlarda yo'q, oxirgi ajratuvchi
+# jamoa nomi.
+
+TIEBREAKERS = [
+    "Points",
+    "Goal Difference",
+    "Goals For",
+    "Away Goals For",
+    "Won",
+    "Away Won",
+    "Opponent Points",
+    "Opponent Goal Difference",
+    "Opponent Goals For",
+]
+
+
+def _played(df):
+    # Natijasi yo'q (hali o'ynalmagan) o'yinlar hisobga olinmaydi
+    return df.dropna(subset=["home_goals", "away_goals"])
+
+
+def match_arrays(df):
+    df = _played(df)
+    codes, teams = pd.factorize(
+        pd.concat([df["home_team"], df["away_team"]], ignore_index=True),
+        sort=True,
+    )
+    n = len(df)
+    return {
+        "teams": teams,
+        "dates": df["date"].to_numpy() if "date" in df.columns else None,
+        "home": codes[:n],
+        "away": codes[n:],
+        "home_goals": df["home_goals"].to_numpy(dtype="float64"),
+        "away_goals": df["away_goals"].to_numpy(dtype="float64"),
+    }
+
+
+# Qo'shiluvchi (additive) hisoblagichlar - yangi o'yinlar shunchaki qo'shiladi
+COUNTERS = [
+    "Played",
+    "Won",
+    "Drawn",
+    "Lost",
+    "Goals For",
+    "Goals Against",
+    "Away Goals For",
+    "Away Won",
+]
+
+
+def match_totals(arrays, size=None):
+    # (jamoa x COUNTERS) hisoblagichlar va (jamoa x jamoa) uchrashuvlar soni
+    home, away = arrays["home"], arrays["away"]
+    hg, ag = arrays["home_goals"], arrays["away_goals"]
+    size = len(arrays["teams"]) if size is None else size
+
+    def count(codes, weights=None):
+        return np.bincount(codes, weights=weights, minlength=size)
+
+    home_win = (hg > ag).astype("float64")
+    away_win = (hg < ag).astype("float64")
+    draw = (hg == ag).astype("float64")
+
+    totals = np.column_stack([
+        count(home) + count(away),
+        count(home, home_win) + count(away, away_win),
+        count(home, draw) + count(away, draw),
+        count(home, away_win) + count(away, home_win),
+        count(home, hg) + count(away, ag),
+        count(home, ag) + count(away, hg),
+        count(away, ag),
+        count(away, away_win),
+    ]).astype("int64")
+
+    meetings = np.bincount(home * size + away, minlength=size * size)
+    meetings = meetings.reshape(size, size)
+    return totals, meetings + meetings.T
+
+
+def table_from_totals(teams, totals, meetings):
+    table = pd.DataFrame(totals, columns=COUNTERS, index=pd.Index(teams, name="Team"))
+    table["Goal Difference"] = table["Goals For"] - table["Goals Against"]
+    table["Points"] = 3 * table["Won"] + table["Drawn"]
+
+    # Raqiblar ko'rsatkichlari: har bir uchrashuv uchun raqibning jami qiymati
+    for col in ["Points", "Goal Difference", "Goals For"]:
+        table[f"Opponent {col}"] = meetings @ table[col].to_numpy()
+
+    table = table[
+        COUNTERS[:6] + ["Goal Difference", "Points"] + COUNTERS[6:]
+        + ["Opponent Points", "Opponent Goal Difference", "Opponent Goals For"]
+    ]
+
+    # lexsort oxirgi kalit bo'yicha birinchi saralaydi; eng oxirgi ajratuvchi
+    # jamoa nomi
+    name_order = np.argsort(np.argsort(np.asarray(teams, dtype=str)))
+    keys = [name_order] + [-table[col].to_numpy() for col in reversed(TIEBREAKERS)]
+    order = np.lexsort(keys)
+    table = table.iloc[order]
+    table["Rank"] = np.arange(1, len(table) + 1)
+    return table
+
+
+def standings_from_arrays(arrays):
+    return table_from_totals(arrays["teams"], *match_totals(arrays))
+
+
+def compute_standings(df):
+    return standings_from_arrays(match_arrays(df))
+
+
+# =========================
+# INCREMENTAL STATE
+# =========================
+# Hisoblagichlar, uchrashuvlar matritsasi va qayta ishlangan qatorlarning
+# hashlari .data_cache ichida saqlanadi. Fayl yangilanganda, agar eski
+# qatorlar o'zgarmagan bo'lsa (hashlari mos), faqat yangi qatorlar
+# qo'shiladi; aks holda holat to'liq qayta quriladi.
+
+STATE_COLUMNS = ["date", "home_team", "away_team", "home_goals", "away_goals"]
+
+
+def _state_path(name):
+    stem = os.path.splitext(os.path.basename(name))[0]
+    return os.path.join(CACHE_DIR, f"{stem}.standings.npz")
+
+
+def row_hashes(df):
+    columns = [col for col in STATE_COLUMNS if col in df.columns]
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+
+def build_state(df):
+    arrays = match_arrays(df)
+    totals, meetings = match_totals(arrays)
+    return {
+        "teams": np.asarray(arrays["teams"], dtype=str),
+        "totals": totals,
+        "meetings": meetings,
+        "hashes": row_hashes(df),
+        "updates": np.int64(0),
+    }
+
+
+def update_state(state, df):
+    # df - to'liq match jadvali; state["hashes"] uning boshiga mos bo'lishi kerak
+    new_rows = df.iloc[len(state["hashes"]):]
+    arrays = match_arrays(new_rows)
+
+    teams = state["teams"]
+    added = np.setdiff1d(np.asarray(arrays["teams"], dtype=str), teams)
+    if len(added):
+        # Yangi jamoalar oxiriga qo'shiladi, mavjud kodlar o'zgarmaydi
+        teams = np.concatenate([teams, added])
+    size = len(teams)
+    lookup = pd.Index(teams).get_indexer(arrays["teams"])
+    arrays = dict(arrays, home=lookup[arrays["home"]], away=lookup[arrays["away"]])
+
+    totals, meetings = match_totals(arrays, size)
+    old = len(state["teams"])
+    totals[:old] += state["totals"]
+    meetings[:old, :old] += state["meetings"]
+    return {
+        "teams": teams,
+        "totals": totals,
+        "meetings": meetings,
+        "hashes": np.concatenate([state["hashes"], row_hashes(new_rows)]),
+        "updates": np.int64(state.get("updates", 0) + 1),
+    }
+
+
+def load_state(name=MATCHES_CSV):
+    try:
+        with np.load(_state_path(name)) as saved:
+            state = {key: saved[key] for key in ["teams", "totals", "meetings", "hashes"]}
+            state["updates"] = saved["updates"] if "updates" in saved else np.int64(0)
+            return state
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_state(state, name=MATCHES_CSV):
+    path = _state_path(name)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **state)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _is_prefix(state, hashes):
+    n = len(state["hashes"])
+    return n <= len(hashes) and np.array_equal(state["hashes"], hashes[:n])
+
+
+def state_standings(state):
+    return table_from_totals(state["teams"], state["totals"], state["meetings"])
+
+
+def state_matches(state, df):
+    # Holat hisoblagichlarini to'liq hisob bilan solishtiradi
+    expected = compute_standings(df)
+    if len(state["teams"]) != len(expected):
+        return False
+    actual = state_standings(state).reindex(expected.index)
+    return actual[COUNTERS].equals(expected[COUNTERS])
+
+
+# Har CHECK_EVERY ta qo'shimcha yangilanishdan keyin holat to'liq hisob
+# bilan tekshiriladi (xatolar yig'ilib qolmasligi uchun)
+CHECK_EVERY = 20
+
+
+def refresh_state(name=MATCHES_CSV, df=None):
+    df = load_matches(name) if df is None else df
+    state = load_state(name)
+
+    if state is not None and _is_prefix(state, row_hashes(df)):
+        if len(state["hashes"]) == len(df):
+            return state
+        state = update_state(state, df)
+        if state["updates"] >= CHECK_EVERY:
+            # Davriy tekshiruv; mos kelmasa holat to'liq qayta quriladi
+            if state_matches(state, df):
+                state["updates"] = np.int64(0)
+            else:
+                state = build_state(df)
+    else:
+        # Eski qatorlar o'zgargan yoki holat yo'q - to'liq qayta qurish
+        state = build_state(df)
+
+    save_state(state, name)
+    return state
+
+
+def check_state(name=MATCHES_CSV):
+    # Saqlangan holatni to'liq hisob bilan solishtiradi; farq bo'lsa
+    # holat qayta quriladi. True - holat to'g'ri edi.
+    df = load_matches(name)
+    state = refresh_state(name, df)
+    if state_matches(state, df):
+        return True
+    save_state(build_state(df), name)
+    return False
+
+
+def standings(name=MATCHES_CSV):
+    return derived(("standings", name), [name], lambda: state_standings(refresh_state(name)))
+
+
+# =========================
+# STANDINGS HISTORY
+# =========================
+# Har bir o'yin ikki qatorga (uy/safar jamoasi) yoyiladi va (sana x jamoa)
+# matritsasiga bincount bilan yig'iladi; har bir sanadan keyingi jadval =
+# axis=0 bo'yicha cumsum. O'rinlar barcha sanalar uchun bitta lexsort bilan
+# (sana birinchi kalit) topiladi. Raqiblarga bog'liq tie-breakerlar har bir
+# sana uchun qayta hisob talab qiladi, shuning uchun tarixda ular o'rniga
+# jamoa nomi ishlatiladi. Sanasi yo'q o'yinlar tarixga kiritilmaydi.
+
+HISTORY_TIEBREAKERS = TIEBREAKERS[:6]
+
+
+def history_from_arrays(arrays):
+    teams = arrays["teams"]
+    size = len(teams)
+
+    date_codes, dates = pd.factorize(arrays["dates"], sort=True)
+    n_dates = len(dates)
+
+    # Sanasi yo'q (NaT) o'yinlar tarixga kirmaydi (factorize kodi -1)
+    dated = date_codes >= 0
+    date_codes = date_codes[dated]
+    home, away = arrays["home"][dated], arrays["away"][dated]
+    hg, ag = arrays["home_goals"][dated], arrays["away_goals"][dated]
+
+    # Uzun format: avval uy jamoalari, keyin safar jamoalari
+    team = np.concatenate([home, away])
+    cell = np.tile(date_codes, 2) * size + team
+    scored = np.concatenate([hg, ag])
+    conceded = np.concatenate([ag, hg])
+    is_away = np.repeat([0.0, 1.0], len(home))
+    won = (scored > conceded).astype("float64")
+    drawn = (scored == conceded).astype("float64")
+
+    def cumulative(weights):
+        daily = np.bincount(cell, weights=weights, minlength=n_dates * size)
+        return daily.reshape(n_dates, size).cumsum(axis=0)
+
+    measures = {
+        "Played": cumulative(None),
+        "Won": cumulative(won),
+        "Points": cumulative(3 * won + drawn),
+        "Goals For": cumulative(scored),
+        "Goal Difference": cumulative(scored - conceded),
+        "Away Goals For": cumulative(scored * is_away),
+        "Away Won": cumulative(won * is_away),
+    }
+
+    date_index = np.repeat(np.arange(n_dates), size)
+    team_index = np.tile(np.arange(size), n_dates)
+    keys = [team_index]
+    keys += [-measures[col].ravel() for col in reversed(HISTORY_TIEBREAKERS)]
+    keys.append(date_index)
+    order = np.lexsort(keys)
+
+    # Sana birinchi kalit, shuning uchun har bir sana bloki ketma-ket keladi
+    rank = np.empty(n_dates * size, dtype="int64")
+    rank[order] = np.tile(np.arange(1, size + 1), n_dates)
+
+    history = pd.DataFrame({
+        "date": np.repeat(dates, size),
+        "Team": np.tile(np.asarray(teams), n_dates),
+    })
+    for col, values in measures.items():
+        history[col] = values.ravel().astype("int64")
+    history["Rank"] = rank
+    return history
+
+
+def standings_history(name=MATCHES_CSV):
+    return derived(
+        ("standings_history", name),
+        [name],
+        lambda: history_from_arrays(match_arrays(load_matches(name))),
+    )
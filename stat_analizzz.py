@@ -1,261 +1,192 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-
-st.set_page_config(page_title="Football Stats Analyzer", layout="wide")
-st.title("Football Stats Analyzer Dashboard")
-
-
-# =========================
-# UNIVERSAL COLUMN CLEANER
-# =========================
-def clean_columns(df):
-    df.columns = (
-        df.columns
-        .str.strip()
-        .str.lower()
-        .str.replace(" ", "_", regex=False)
-        .str.replace("-", "_", regex=False)
-        .str.replace("(", "", regex=False)
-        .str.replace(")", "", regex=False)
-        .str.replace("%", "", regex=False)
-    )
-    return df
-
-
-# =========================
-# AUTO NUMERIC CONVERTER
-# =========================
-def convert_numeric(df):
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="ignore")
-    return df
-
-
-# =========================
-# LOAD DATA
-# =========================
-@st.cache_data
-def load_data():
-
-    attacking = clean_columns(pd.read_csv("attacking_data.csv"))
-    defending = clean_columns(pd.read_csv("defending_data.csv"))
-    goalkeeping = clean_columns(pd.read_csv("goalkeeping_data.csv"))
-    goals = clean_columns(pd.read_csv("goals_data.csv"))
-    disciplinary = clean_columns(pd.read_csv("disciplinary_data.csv"))
-    players = clean_columns(pd.read_csv("players_data.csv"))
-    teams = clean_columns(pd.read_csv("teams_data.csv"))
-
-    attacking = convert_numeric(attacking)
-    defending = convert_numeric(defending)
-    goalkeeping = convert_numeric(goalkeeping)
-    goals = convert_numeric(goals)
-    disciplinary = convert_numeric(disciplinary)
-    teams = convert_numeric(teams)
-
-
-
-    # Merge if id_player mavjud bo‘lsa
-    if "id_player" in players.columns:
-        for df in [attacking, defending, goalkeeping, goals, disciplinary]:
-            if "id_player" in df.columns:
-                df.merge(players, on="id_player", how="left")
-
-        attacking = attacking.merge(players, on="id_player", how="left")
-        defending = defending.merge(players, on="id_player", how="left")
-        goalkeeping = goalkeeping.merge(players, on="id_player", how="left")
-        goals = goals.merge(players, on="id_player", how="left")
-        disciplinary = disciplinary.merge(players, on="id_player", how="left")
-
-    return attacking, defending, goalkeeping, goals, disciplinary, players, teams
-
-
-attacking, defending, goalkeeping, goals, disciplinary, players, teams = load_data()
-
-
-# =========================
-# SIDEBAR
-# =========================
-st.sidebar.title("Navigation")
-page = st.sidebar.selectbox(
-    "Select Section",
-    [
-        "Home",
-        "Top Scorers",
-        "Playmakers",
-        "Defenders",
-        "Goalkeepers",
-        "Discipline",
-        "Team",
-    ],
-)
-
-
-# =========================
-# HOME
-# =========================
-if page == "Home":
-
-    col1, col2, col3 = st.columns(3)
-
-    total_goals = goals["goals"].sum() if "goals" in goals.columns else 0
-
-    col1.metric("Total Teams", len(teams))
-    col2.metric("Total Players", len(players))
-    col3.metric("Total Goals", int(total_goals))
-
-
-# =========================
-# TOP SCORERS
-# =========================
-elif page == "Top Scorers":
-
-    if "goals" in goals.columns:
-
-        top = goals.sort_values("goals", ascending=False).head(10)
-
-        fig = px.bar(
-            top,
-            x="player_name" if "player_name" in top.columns else top.columns[0],
-            y="goals",
-            title="Top 10 Goal Scorers",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(top)
-
-    else:
-        st.warning("Goals column not found.")
-
-
-# =========================
-# PLAYMAKERS
-# =========================
-elif page == "Playmakers":
-
-    if "assists" in attacking.columns:
-
-        top = attacking.sort_values("assists", ascending=False).head(10)
-
-        fig = px.bar(
-            top,
-            x="player_name" if "player_name" in top.columns else top.columns[0],
-            y="assists",
-            title="Top Assist Providers",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(top)
-
-    else:
-        st.warning("Assists column not found.")
-
-
-# =========================
-# DEFENDERS
-# =========================
-elif page == "Defenders":
-
-    if "tackles" in defending.columns:
-
-        top = defending.sort_values("tackles", ascending=False).head(10)
-
-        fig = px.bar(
-            top,
-            x="player_name" if "player_name" in top.columns else top.columns[0],
-            y="tackles",
-            title="Top Tacklers",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(top)
-
-    else:
-        st.warning("Tackles column not found.")
-
-
-# =========================
-# GOALKEEPERS
-# =========================
-elif page == "Goalkeepers":
-
-    if "saves" in goalkeeping.columns:
-
-        top = goalkeeping.sort_values("saves", ascending=False).head(10)
-
-        fig = px.bar(
-            top,
-            x="player_name" if "player_name" in top.columns else top.columns[0],
-            y="saves",
-            title="Top Goalkeepers",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(top)
-
-    else:
-        st.warning("Saves column not found.")
-
-
-# =========================
-# DISCIPLINE
-# =========================
-elif page == "Discipline":
-
-    if "yellow_cards" in disciplinary.columns and "red_cards" in disciplinary.columns:
-
-        disciplinary["total_cards"] = (
-            disciplinary["yellow_cards"] + disciplinary["red_cards"]
-        )
-
-        top = disciplinary.sort_values("total_cards", ascending=False).head(10)
-
-        fig = px.bar(
-            top,
-            x="player_name" if "player_name" in top.columns else top.columns[0],
-            y="total_cards",
-            title="Most Booked Players",
-        )
-        st.plotly_chart(fig, use_container_width=True)
-        st.dataframe(top)
-
-    else:
-        st.warning("Card columns not found.")
-
-
-# =========================
-# TEAM COMPARISON
-# =========================
-elif page == "Team Comparison":
-
-    if "team" in teams.columns:
-
-        team_list = teams["team"].unique()
-
-        team1 = st.selectbox("Select Team 1", team_list)
-        team2 = st.selectbox("Select Team 2", team_list)
-
-        team1_data = teams[teams["team"] == team1]
-        team2_data = teams[teams["team"] == team2]
-
-        comparison = pd.concat([team1_data, team2_data])
-
-        numeric_cols = comparison.select_dtypes(include="number").columns
-
-        if len(numeric_cols) > 0:
-            fig = px.bar(
-                comparison,
-                x="team",
-                y=numeric_cols,
-                barmode="group",
-                title="Team Comparison",
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            st.dataframe(comparison)
-        else:
-            st.warning("No numeric columns available.")
-
-    else:
-
-        st.warning("team column not found.")
-
-
-
-
-
+import streamlit as st
+import plotly.express as px
+
+from leaderboard import get_top, player_leaderboard
+from player_data import load_table, player_facts
+from team_stats import TEAM_SUMS, compare_teams, team_stats
+
+st.set_page_config(page_title="Football Stats Analyzer", layout="wide")
+st.title("Football Stats Analyzer Dashboard")
+
+
+# =========================
+# PAGES
+# =========================
+# Har bir sahifa o'ziga kerakli statistika jadvallarini e'lon qiladi
+PAGE_TABLES = {
+    "Home": ["goals"],
+    "Top Scorers": ["goals"],
+    "Playmakers": ["attacking"],
+    "Defenders": ["defending"],
+    "Goalkeepers": ["goalkeeping"],
+    "Discipline": ["disciplinary"],
+    "Team Comparison": [],
+}
+
+
+# =========================
+# SIDEBAR
+# =========================
+st.sidebar.title("Navigation")
+page = st.sidebar.selectbox("Select Section", list(PAGE_TABLES))
+
+
+# =========================
+# LOAD DATA
+# =========================
+# Faqat tanlangan sahifa jadvallari yuklanadi va player fact jadvaliga
+# qo'shiladi (player_data.py)
+def load_data(page):
+    return player_facts(PAGE_TABLES[page]), load_table("teams")
+
+
+facts, teams = load_data(page)
+
+
+# =========================
+# HOME
+# =========================
+if page == "Home":
+
+    col1, col2, col3 = st.columns(3)
+
+    total_goals = facts["goals"].sum() if "goals" in facts.columns else 0
+
+    col1.metric("Total Teams", len(teams))
+    col2.metric("Total Players", len(facts))
+    col3.metric("Total Goals", int(total_goals))
+
+
+# =========================
+# TOP SCORERS
+# =========================
+elif page == "Top Scorers":
+
+    if "goals" in facts.columns:
+
+        top = get_top(player_leaderboard("goals"), "goals")
+
+        fig = px.bar(
+            top,
+            x="player_name" if "player_name" in top.columns else top.columns[0],
+            y="goals",
+            title="Top 10 Goal Scorers",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(top)
+
+    else:
+        st.warning("Goals column not found.")
+
+
+# =========================
+# PLAYMAKERS
+# =========================
+elif page == "Playmakers":
+
+    if "assists" in facts.columns:
+
+        top = get_top(player_leaderboard("attacking"), "assists")
+
+        fig = px.bar(
+            top,
+            x="player_name" if "player_name" in top.columns else top.columns[0],
+            y="assists",
+            title="Top Assist Providers",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(top)
+
+    else:
+        st.warning("Assists column not found.")
+
+
+# =========================
+# DEFENDERS
+# =========================
+elif page == "Defenders":
+
+    if "tackles" in facts.columns:
+
+        top = get_top(player_leaderboard("defending"), "tackles")
+
+        fig = px.bar(
+            top,
+            x="player_name" if "player_name" in top.columns else top.columns[0],
+            y="tackles",
+            title="Top Tacklers",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(top)
+
+    else:
+        st.warning("Tackles column not found.")
+
+
+# =========================
+# GOALKEEPERS
+# =========================
+elif page == "Goalkeepers":
+
+    if "saves" in facts.columns:
+
+        top = get_top(player_leaderboard("goalkeeping"), "saves")
+
+        fig = px.bar(
+            top,
+            x="player_name" if "player_name" in top.columns else top.columns[0],
+            y="saves",
+            title="Top Goalkeepers",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(top)
+
+    else:
+        st.warning("Saves column not found.")
+
+
+# =========================
+# DISCIPLINE
+# =========================
+elif page == "Discipline":
+
+    if "yellow_cards" in facts.columns and "red_cards" in facts.columns:
+
+        top = get_top(player_leaderboard("disciplinary"), "total_cards")
+
+        fig = px.bar(
+            top,
+            x="player_name" if "player_name" in top.columns else top.columns[0],
+            y="total_cards",
+            title="Most Booked Players",
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.dataframe(top)
+
+    else:
+        st.warning("Card columns not found.")
+
+
+# =========================
+# TEAM COMPARISON
+# =========================
+elif page == "Team Comparison":
+
+    # Jamoa ko'rsatkichlari oldindan yig'ilgan (team_stats.py)
+    cube = team_stats()
+    team_list = list(cube.index)
+
+    team1 = st.selectbox("Select Team 1", team_list)
+    team2 = st.selectbox("Select Team 2", team_list, index=1)
+
+    comparison = compare_teams(cube, team1, team2)
+
+    fig = px.bar(
+        comparison,
+        x="team",
+        y=TEAM_SUMS,
+        barmode="group",
+        title="Team Comparison",
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.dataframe(comparison)
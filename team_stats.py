@@ -0,0 +1,45 @@
+from data_cache import derived
+from player_data import PLAYER_FILES, STAT_TABLES, load_table, player_facts
+
+# =========================
+# TEAM AGGREGATE CUBE
+# =========================
+# teams_data.csv da faqat id/country/team/logo bor, shuning uchun jamoa
+# ko'rsatkichlari o'yinchi statistikasidan players.id_team bo'yicha bitta
+# groupby bilan yig'iladi. Jadval jamoa nomi bo'yicha indekslangan va
+# dataset versiyasi uchun keshlanadi: ikki jamoani solishtirish = ikki .loc.
+
+TEAM_SUMS = [
+    "goals",
+    "assists",
+    "tackles",
+    "balls_recovered",
+    "saves",
+    "clean_sheets",
+    "yellow_cards",
+    "red_cards",
+]
+TEAM_MEANS = {"age": "avg_age", "heightcm": "avg_height"}
+
+
+def build_team_stats(facts, teams):
+    aggregations = {col: (col, "sum") for col in TEAM_SUMS}
+    aggregations.update({name: (col, "mean") for col, name in TEAM_MEANS.items()})
+    aggregations["players"] = ("player_name", "size")
+
+    cube = facts.groupby("id_team").agg(**aggregations)
+    cube = cube.join(teams[["team", "country"]], how="inner")
+    cube = cube.set_index("team")
+    return cube.round({name: 1 for name in TEAM_MEANS.values()})
+
+
+def team_stats():
+    return derived(
+        ("teams", "aggregate"),
+        PLAYER_FILES,
+        lambda: build_team_stats(player_facts(STAT_TABLES), load_table("teams")),
+    )
+
+
+def compare_teams(cube, team1, team2):
+    return cube.loc[[team1, team2]].reset_index()